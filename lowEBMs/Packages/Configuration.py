@@ -556,10 +556,12 @@ def add_sellersparameters(config,importer,file,transfernumber,downwardnumber,sol
     #rewriting the incoming radiation parameters with conversion + choice to be activated or not
     funcin=config['funccomp']['funcparam']['func'+str(downwardnumber)]
     if albedo==True:
-        funcin['albedoparam'][0]=lna(Z)
-        funcin['albedoparam'][1]=lna(b)
+        #kept in float64 independent of the order of calls to variable_importer, albedo.dynamic_sel
+        #evaluates them into work arrays of the precision Vars.dtype
+        funcin['albedoparam'][0]=np.asarray(Z,dtype=np.float64)
+        funcin['albedoparam'][1]=np.asarray(b,dtype=np.float64)
     if solar==True:
-        Vars.Solar=lna(Q)*1.327624658#1.2971#
+        Vars.Solar=np.ascontiguousarray(Q,dtype=np.float64)*1.327624658#1.2971#
     configout=config
     configout['funccomp']['funcparam']['func'+str(transfernumber)]=funct
     configout['funccomp']['funcparam']['func'+str(downwardnumber)]=funcin
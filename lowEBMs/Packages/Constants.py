@@ -30,3 +30,4 @@ cw = 4181.3      # specific heat of liquid water (J / kg / K)
 mb_to_Pa = 100.
 time_sec_year=60*60*24*365
 time_sec_day=60*60*24
+time_sec_unit={'minute': 60, 'hour': 60*60, 'day': 60*60*24, 'week': 60*60*24*7, 'month': 60*60*24*365/12, 'year': 60*60*24*365}  # seconds per timeunit of forcing data
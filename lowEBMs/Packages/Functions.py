@@ -42,6 +42,7 @@ import numpy as np
 #import scipy
 import builtins
 import time
+import os
 from lowEBMs.Packages.Variables import Vars
 import lowEBMs.Packages.Constants as const
 #import xarray as xr
@@ -196,16 +197,19 @@ class flux_down:
         """
         #Incoming radiation with latitudal dependence, albedo transition for T<T_ice, without noise
         #R_ininsolalbedo=[Conversion,alpha_p,T_ice,m]
-        key=list(funcparam.keys())
-        list_parameters=list(funcparam.values())
         #Loading inputparameters
-        Q,factor_solar,dQ,albedofunc,albedoread,albedofuncparam,noise,noiseamp,noisedelay,    seed,seedmanipulation,solarinput,convfactor,timeunit,orbital,orbitalyear,updatefrequency=list_parameters#R_ininsolalbedoparam
+        Q,factor_solar,dQ,albedofunc,albedoread,albedofuncparam,noise,noiseamp,noisedelay,    seed,seedmanipulation,solarinput,convfactor,timeunit,orbital,orbitalyear,updatefrequency=funcparam.values()#R_ininsolalbedoparam
+
+        #With a temperature independent albedo R_in only changes from one RK4 step to the next,
+        #so the intermediate evaluations reuse the value of the first one (unless a forcing changed TSI/AOD).
+        #The value is kept in a separate buffer and copied to the returned one, so changes to the returned array
+        #do not alter the cache
+        static_albedo=getattr(albedofunc,'__func__',None) in (albedo.static,albedo.static_bud)
+        if static_albedo and builtins.Runtime_Tracker % 4 != 0 and Vars.R_in_cache[1:]==[Vars.TSI,Vars.AOD]:
+            R_in=work_array('Rdown',np.shape(Vars.R_in_cache[0]))
+            np.copyto(R_in,Vars.R_in_cache[0])
+            return R_in
 
-        if builtins.Runtime_Tracker==0 and Vars.TSI==float:
-            Vars.TSI=0
-        if builtins.Runtime_Tracker==0 and Vars.AOD==float:
-            Vars.AOD=0    
-            
         if updatefrequency=='number_of_integration':
             updatefrequency=builtins.number_of_integration
         if builtins.Runtime_Tracker % (4*updatefrequency) == 0:
@@ -214,42 +218,50 @@ class flux_down:
                 #with orbital variations (if False by default present day)
                 if orbital==True: 
                     if builtins.spatial_resolution==0:
-
-                        Vars.Lat=np.linspace(-85,85,18)
+                        #the global mean is taken on a fixed grid, so that its weights are computed only once
+                        Vars.Lat=Vars.Lat_0D
 
                         Q=earthsystem().solarradiation_orbital(convfactor,orbitalyear,'annualmean',Q)
-                        Vars.solar=np.average(Q, weights=cosd(Vars.Lat))
+                        Vars.solar=np.dot(Q,lat_weights('Lat'))
                     else:
                         Vars.solar=earthsystem().solarradiation_orbital(convfactor,orbitalyear,timeunit,Q)
                     
                 else:
                     if builtins.spatial_resolution==0:
-
-                        Vars.Lat=np.linspace(-85,85,18)
+                        #the global mean is taken on a fixed grid, so that its weights are computed only once
+                        Vars.Lat=Vars.Lat_0D
                         #Q=earthsystem().solarradiation_self(convfactor,'annualmean',orbitalyear,Q)
                         Q=earthsystem().solarradiation(convfactor,'annualmean',orbitalyear,Q)
-                        Vars.solar=np.average(Q, weights=cosd(Vars.Lat))
+                        Vars.solar=np.dot(Q,lat_weights('Lat'))
                     else:
                         #Vars.solar=earthsystem().solarradiation_self(convfactor,timeunit,orbitalyear,Q)
 
                         Vars.solar=earthsystem().solarradiation(convfactor,timeunit,orbitalyear,Q)
+                if builtins.spatial_resolution>0:
+                    Vars.solar=np.asarray(Vars.solar,dtype=Vars.dtype)
 
             #total solar insolation with possible offset
             else:
                 Vars.solar=Q
 
+        #whether this is a readout step, checked once for the readouts below
+        readout_step=builtins.Runtime_Tracker % builtins.readout_period == 0
+
         if solarinput==False and builtins.spatial_resolution==0:
             Q_total=Vars.solar+dQ+Vars.TSI
         else:
             Q_total=Vars.solar+dQ
         if Vars.AOD != 0:
-            Q_aod=Q_total*np.exp(-Vars.AOD)
+            #the attenuation only changes with the AOD, which is updated by the forcing at most once per step
+            if Vars.AOD_factor[0]!=Vars.AOD:
+                Vars.AOD_factor=[Vars.AOD,np.exp(-Vars.AOD)]
+            Q_aod=Q_total*Vars.AOD_factor[1]
         
         #if builtins.Runtime_Tracker==0:
         #    if len(Q_total)!=1:
         #        Vars.Read['solar']=np.reshape(np.zeros(len(Vars.Read['solar'])*len(Q_total)),(len(Vars.Read['solar']),len(Q_total)))
-        if builtins.Runtime_Tracker % (4*builtins.data_readout) == 0:
-            Vars.Read['solar'][int(builtins.Runtime_Tracker/(4*builtins.data_readout))]=Q_total            
+        if readout_step:
+            readout('solar',Q_total)            
         
         #Calculating albedo from given albedofunction
         alpha=albedofunc(*albedofuncparam) 
@@ -258,36 +270,42 @@ class flux_down:
             #if builtins.Runtime_Tracker==0:
             #    if len(alpha)!=1:
             #        Vars.Read['alpha']=np.reshape(np.zeros(len(Vars.Read['alpha'])*len(alpha)),(len(Vars.Read['alpha']),len(alpha)))
-            if builtins.Runtime_Tracker % (4*builtins.data_readout) == 0:    #Only on 4th step (due to rk4)
-                Vars.alpha=alpha
-                Vars.Read['alpha'][int(builtins.Runtime_Tracker/(4*builtins.data_readout))]=alpha
-
-        #Noise factor z on the solar insolation        
-        z=0
-        if builtins.Runtime_Tracker % 4 == 0:
-            if noise==True:
-                #possible noisedelay which indicates a gap between updating the noise factor
-                if (int(Vars.t/builtins.stepsize_of_integration) % noisedelay)==0:
-                    #seed if same noise is desired
-                    if seed==True:
-                        np.random.seed(int(Vars.t)+seedmanipulation)
-                    z=np.random.normal(0,noiseamp)
-                    #write to builtins and output
-                builtins.Noise_Tracker=z 
-
-        z=builtins.Noise_Tracker
-        if builtins.Runtime_Tracker % (4*builtins.data_readout)==0:
-            Vars.Read['noise'][int(builtins.Runtime_Tracker/(4*builtins.data_readout))]=z
+            if readout_step:    #Only on 4th step (due to rk4)
+                Vars.alpha=np.copy(alpha)
+                readout('alpha',alpha)
+
+        #Noise factor z on the solar insolation, updated on the first RK4 step and kept for the others
+        if noise==True and builtins.Runtime_Tracker % 4 == 0:
+            z=0
+            #possible noisedelay which indicates a gap between updating the noise factor
+            if (int(Vars.t/builtins.stepsize_of_integration) % noisedelay)==0:
+                #seed if same noise is desired
+                if seed==True:
+                    np.random.seed(int(Vars.t)+seedmanipulation)
+                z=np.random.normal(0,noiseamp)
+            #write to builtins and output
+            builtins.Noise_Tracker=z 
+        else:
+            z=builtins.Noise_Tracker
+        if readout_step:
+            readout('noise',z)
         #Calculating solar insolation distribution from functions using climlab
         
-        #Equation of incoming radiation
+        #Equation of incoming radiation, evaluated in place in a preallocated array
         #print(Q_total.shape,alpha.shape,type(Q_total),type(alpha),factor_solar.shape)
         if Vars.AOD != 0:
-            R_in=(Q_aod+z)*(1-alpha)*factor_solar
+            Q_in=Q_aod+z
         else:
-            R_in=(Q_total+z)*(1-alpha)*factor_solar
-        if builtins.Runtime_Tracker % (4*builtins.data_readout) == 0:    #Only on 4th step (due to rk4)
-            Vars.Read['Rdown'][int(builtins.Runtime_Tracker/(4*builtins.data_readout))]=R_in
+            Q_in=Q_total+z
+        R_in=np.subtract(1,alpha,out=work_array('Rdown',np.broadcast(Q_in,alpha,factor_solar).shape))
+        R_in*=Q_in
+        R_in*=factor_solar
+        if readout_step:    #Only on 4th step (due to rk4)
+            readout('Rdown',R_in)
+        if static_albedo:
+            cache=work_array('Rdown_cache',np.shape(R_in))
+            np.copyto(cache,R_in)
+            Vars.R_in_cache=[cache,Vars.TSI,Vars.AOD]
         return R_in
 
 class albedo:
@@ -371,16 +389,19 @@ class albedo:
         #Albedo function as used in budyko (1969), with  2albedo transitions fixed to latitudes (border_1, border_2)
         #and fixed albedos, with intermediate case +0.18 and arctic case +0.3
         
-        #creating and filling array, depending on the current latitudinal temperature
-        albedo=[0]*len(Vars.Lat)
-        for i in range(len(Vars.Lat)):
-            if np.abs(Vars.Lat[i]) <= border_1:
-                albedo[i]=alpha_p
-            if np.abs(Vars.Lat[i]) <= border_2 and np.abs(Vars.Lat[i]) > border_1:
-                albedo[i]=alpha_p+0.18
-            if np.abs(Vars.Lat[i]) <= 90 and np.abs(Vars.Lat[i]) > border_2:
-                albedo[i]=alpha_p+0.3
-        return np.array(albedo)
+        #filling the zones of all latitudes at once into a preallocated array, the arctic zone taking precedence over
+        #the intermediate and the intermediate over the low albedo zone (parameters given per ensemble member act on their row)
+        if builtins.parallelization==True:
+            alpha_p,border_1,border_2=parallel_columns(alpha_p,border_1,border_2)
+        if Vars.Lat_abs[0] is not Vars.Lat:
+            Vars.Lat_abs=[Vars.Lat,np.abs(Vars.Lat)]
+        Lat=Vars.Lat_abs[1]
+        albedo=work_array('alpha',np.broadcast(Lat,alpha_p,border_1,border_2).shape)
+        albedo.fill(0)
+        np.copyto(albedo,alpha_p,where=Lat<=border_1)
+        np.copyto(albedo,alpha_p+0.18,where=(Lat<=border_2)&(Lat>border_1))
+        np.copyto(albedo,alpha_p+0.3,where=(Lat<=90)&(Lat>border_2))
+        return albedo
 
     def dynamic_bud(self,T_1,T_2,alpha_0,alpha_1,alpha_2):
 
@@ -442,38 +463,16 @@ class albedo:
         #Defining a 3State albedo function, with temperature dependant albedo transitions at T_1 (alpha_0 to 
         #alpha_1) and T_2 (alpha_1 to alpha_2), with alpha_0 ice free, alpha_1 intermediate and alpha_2 ice
         
-        #Creating array and filling with values, depending on the current latitudinal temperature
+        #Filling the albedo of all latitudes at once into a preallocated array, depending on the current latitudinal
+        #temperature, with alpha_2 taking precedence over alpha_1 (parameters given per ensemble member act on their row)
         if builtins.parallelization==True:
-            
-            albedo=np.array([[0]*len(Vars.Lat)]*builtins.number_of_parallels)
-            if len(T_1)==builtins.number_of_parallels:  
-                for i in range(builtins.number_of_parallels):          
-                    for j in range(len(Vars.Lat)):
-                        if Vars.T[i,j]>T_1[i]:
-                            albedo[i,j]=alpha_0[i]
-                        if Vars.T[i,j]<=T_1[i]:
-                            albedo[i,j]=alpha_1[i]
-                        if Vars.T[j]<=T_2[i]:
-                            albedo[i,j]=alpha_2[i]
-            else:
-                for i in range(builtins.number_of_parallels):          
-                    for j in range(len(Vars.Lat)):
-                        if Vars.T[i,j]>T_1:
-                            albedo[i,j]=alpha_0
-                        if Vars.T[i,j]<=T_1:
-                            albedo[i,j]=alpha_1
-                        if Vars.T[j]<=T_2:
-                            albedo[i,j]=alpha_2
-        else:
-            albedo=[0]*len(Vars.Lat)
-            for j in range(len(Vars.Lat)):
-                if Vars.T[j]>T_1:
-                    albedo[j]=alpha_0
-                if Vars.T[j]<=T_1:
-                    albedo[j]=alpha_1
-                if Vars.T[j]<=T_2:
-                    albedo[j]=alpha_2
-        return np.array(albedo)
+            T_1,T_2,alpha_0,alpha_1,alpha_2=parallel_columns(T_1,T_2,alpha_0,alpha_1,alpha_2)
+        albedo=work_array('alpha')
+        albedo.fill(0)
+        np.copyto(albedo,alpha_0,where=Vars.T>T_1)
+        np.copyto(albedo,alpha_1,where=Vars.T<=T_1)
+        np.copyto(albedo,alpha_2,where=Vars.T<=T_2)
+        return albedo
 
     def smooth(self,T_ref,alpha_f,alpha_i,steepness):
         """
@@ -522,8 +521,16 @@ class albedo:
   
         """
         #Defining a smooth abledotransition from an icefree albedo alpha_f to an icecovered albedo alpha_i
-        #with the steepness gamma and the reference temperature for the transition T_ref, refering to north
-        albedo=alpha_i-1/2*(alpha_i-alpha_f)*(1+np.tanh(steepness*(Vars.T-T_ref)))
+        #with the steepness gamma and the reference temperature for the transition T_ref, refering to north.
+        #The expression is evaluated in place in a preallocated array (parameters given per ensemble member act on their row)
+        if builtins.parallelization==True:
+            T_ref,alpha_f,alpha_i,steepness=parallel_columns(T_ref,alpha_f,alpha_i,steepness)
+        albedo=np.subtract(Vars.T,T_ref,out=work_array('alpha'))
+        albedo*=steepness
+        np.tanh(albedo,out=albedo)
+        albedo+=1
+        albedo*=-(1/2*(alpha_i-alpha_f))
+        albedo+=alpha_i
         return albedo
 
     def dynamic_sel(self,Z,b):
@@ -566,38 +573,16 @@ class albedo:
         
         #Shift of the temperature with the elevation to gain surface temperatures
 
-        Tg=Vars.T-0.0065*Z
-        #creating and filling array, depending on the current latitudinal temperature
-        if builtins.parallelization==True:
-            albedo=np.reshape(np.zeros(len(Vars.Lat)*builtins.number_of_parallels),(builtins.number_of_parallels,len(Vars.Lat)))
-            if len(Z)==builtins.number_of_parallels:  
-                for i in range(builtins.number_of_parallels):                
-                    for j in range(len(Vars.Lat)):
-                        if Tg[i,j]<283.16:
-                            albedo[i,j]=b[i,j]-0.009*Tg[i,j]
-                        else:
-                            albedo[i,j]=b[i,j]-2.548
-                        if albedo[i,j]>0.85:
-                            albedo[i,j]=0.85
-            else:
-                for i in range(builtins.number_of_parallels):                
-                    for j in range(len(Vars.Lat)):
-                        if Tg[i,j]<283.16:
-                            albedo[i,j]=b[j]-0.009*Tg[i,j]
-                        else:
-                            albedo[i,j]=b[j]-2.548
-                        if albedo[i,j]>0.85:
-                            albedo[i,j]=0.85
-        else:
-            albedo=[0]*len(Tg)
-            for j in range(len(Tg)):
-                if Tg[j]<283.16:
-                    albedo[j]=b[j]-0.009*Tg[j]
-                else:
-                    albedo[j]=b[j]-2.548
-                if albedo[j]>0.85:
-                    albedo[j]=0.85
-        return np.array(albedo)
+        Tg=np.multiply(Z,-0.0065,out=work_array('Tg',np.broadcast(Vars.T,Z).shape))
+        Tg+=Vars.T
+        #evaluating the linear dependence on the whole grid into a preallocated array, as b minus the temperature
+        #term (0.009*Tg or 2.548), with a maximum albedo of 0.85
+        #(Z and b are given per latitude or per ensemble member and latitude)
+        albedo=np.multiply(Tg,0.009,out=work_array('alpha',np.broadcast(Tg,b).shape))
+        np.copyto(albedo,2.548,where=np.logical_not(Tg<283.16))
+        np.subtract(b,albedo,out=albedo)
+        np.minimum(albedo,0.85,out=albedo)
+        return albedo
 
 class flux_up:
     """ 
@@ -655,29 +640,25 @@ class flux_up:
         """
         #Outgoing radiation, from empirical approximation formula by Budyko (no clouds)
         #R_outbudncparam=[A,B]
-        list_parameters=list(funcparam.values())
-        Activation,A,B=list_parameters
-        
+        Activation,A,B=funcparam.values()
+        #R_out=-(A+B*(T-273.15)) is evaluated in the preallocated work array as -B*T-(A-273.15*B),
+        #with the offset of the temperature in celsius folded into the constant
         if builtins.parallelization==True:
-            paras=[A,B]
-            A,B=[np.transpose(np.array([paras[i]]*len(Vars.Lat))) if np.shape(paras[i])==(builtins.number_of_parallels,) else paras[i] for i in range(len(paras))]
-            if type(Activation)==bool:
-                R_out=-(A+B*(Vars.T-273.15))
-            else:
-                R_out=np.reshape(np.zeros(builtins.number_of_parallels*len(Vars.Lat)),(builtins.number_of_parallels,len(Vars.Lat)))
-                for i in range(builtins.number_of_parallels):
-                    if Activation[i]==False:
-                        R_out[i]=np.zeros(len(Vars.Lat))
-                    else:
-                        R_out[i]=-(A+B*(Vars.T[i]-273.15))
+            A,B=parallel_columns(A,B)
+            R_out=np.multiply(Vars.T,-B,out=work_array('Rup'))
+            np.subtract(R_out,A-273.15*B,out=R_out)
+            if type(Activation)!=bool:
+                #the flux of the ensemble members with a deactivated flux is 0
+                np.copyto(R_out,0,where=np.logical_not(np.reshape(np.asarray(Activation,dtype=bool),(-1,1))))
                     
         else:
             if Activation==False:
                 R_out=0
             else:
-                R_out=-(A+B*(Vars.T-273.15))
-        if builtins.Runtime_Tracker % (4*builtins.data_readout) == 0:    #Only on 4th step (due to rk4)
-                Vars.Read['Rup'][int(builtins.Runtime_Tracker/(4*builtins.data_readout))]=R_out
+                R_out=np.multiply(Vars.T,-B,out=work_array('Rup'))
+                np.subtract(R_out,A-273.15*B,out=R_out)
+        if builtins.Runtime_Tracker % builtins.readout_period == 0:    #Only on 4th step (due to rk4)
+                readout('Rup',R_out)
         return R_out
 
     def budyko_clouds(self,funcparam):
@@ -734,31 +715,33 @@ class flux_up:
         """
         #Outgoing radiation, from empirical approximation formula by Budyko (clouds)
         #R_outbudcparam=[A,B,A1,B1,f_c]
-        list_parameters=list(funcparam.values())
-        Activation,A,B,A1,B1,f_c=list_parameters
+        Activation,A,B,A1,B1,f_c=funcparam.values()
         if builtins.parallelization==True:
-            paras=[A,B,A1,B1,f_c]
-            A,B,A1,B1,f_c=[np.transpose(np.array([paras[i]]*len(Vars.Lat))) if np.shape(paras[i])==(builtins.number_of_parallels,) else paras[i] for i in range(len(paras))]
-            if type(Activation)==bool:
-                R_out=-(A+B*(Vars.T-273.15)-(A1+B1*(Vars.T-273.15))*f_c)
-            else:
-                R_out=np.reshape(np.zeros(builtins.number_of_parallels*len(Vars.Lat)),(builtins.number_of_parallels,len(Vars.Lat)))
-                for i in range(builtins.number_of_parallels):
-                    if Activation[i]==False:
-                        R_out[i]=np.zeros(len(Vars.Lat))
-                    else:
-                        R_out[i]=-(A+B*(Vars.T[i]-273.15)-(A1+B1*(Vars.T[i]-273.15))*f_c)
+            A,B,A1,B1,f_c=parallel_columns(A,B,A1,B1,f_c)
+            R_out=flux_up._budyko_clouds(A,B,A1,B1,f_c)
+            if type(Activation)!=bool:
+                #the flux of the ensemble members with a deactivated flux is 0
+                np.copyto(R_out,0,where=np.logical_not(np.reshape(np.asarray(Activation,dtype=bool),(-1,1))))
                     
         else:
             if Activation==False:
-                R_out=np.zeros(len(Vars.Lat))
+                R_out=0
             else:
-                R_out=-(A+B*(Vars.T-273.15)-(A1+B1*(Vars.T-273.15))*f_c)
-        if builtins.Runtime_Tracker % (4*builtins.data_readout) == 0:    #Only on 4th step (due to rk4)
-            Vars.Read['Rup'][int(builtins.Runtime_Tracker/(4*builtins.data_readout))]=R_out
+                R_out=flux_up._budyko_clouds(A,B,A1,B1,f_c)
+        if builtins.Runtime_Tracker % builtins.readout_period == 0:    #Only on 4th step (due to rk4)
+            readout('Rup',R_out)
                 
         return R_out
 
+    @staticmethod
+    def _budyko_clouds(A,B,A1,B1,f_c):
+        #R_out=-(A+B*T_C-(A1+B1*T_C)*f_c) evaluated in the preallocated work array as
+        #-(A-A1*f_c-273.15*(B-B1*f_c))-(B-B1*f_c)*T, the composite constants (with the offset of the
+        #temperature in celsius T_C=T-273.15) are formed once per call
+        B_c=B-B1*f_c
+        R_out=np.multiply(Vars.T,-B_c,out=work_array('Rup'))
+        return np.subtract(R_out,A-A1*f_c-273.15*B_c,out=R_out)
+
     def planck(self,funcparam):
         """ 
         The stefan-boltzmann radiation for a grey body as radiative energy flux directed upward. The ideal stefan-boltzmann radiation with a temperature to the power of 4 scaled with an emissivity factor :math:`\epsilon`.
@@ -796,28 +779,21 @@ class flux_up:
         """
         #Outgoing radiation, from plancks radiation law
         #R_outplanckparam=[grey,sig]
-        list_parameters=list(funcparam.values())
-        Activation,grey,sig=list_parameters
+        Activation,grey,sig=funcparam.values()
         if builtins.parallelization==True:
-            paras=[grey,sig]
-            grey,sig=[np.transpose(np.array([paras[i]]*len(Vars.Lat))) if np.shape(paras[i])==(builtins.number_of_parallels,) else paras[i] for i in range(len(paras))]
-            if type(Activation)==bool:
-                R_out=-(grey*sig*Vars.T**4)
-            else:
-                R_out=np.reshape(np.zeros(builtins.number_of_parallels*len(Vars.Lat)),(builtins.number_of_parallels,len(Vars.Lat)))
-                for i in range(builtins.number_of_parallels):
-                    if Activation[i]==False:
-                        R_out[i]=np.zeros(len(Vars.Lat))
-                    else:
-                        R_out[i]=-(grey*sig*Vars.T[i]**4)
+            grey,sig=parallel_columns(grey,sig)
+            R_out=flux_up._planck(grey*sig)
+            if type(Activation)!=bool:
+                #the flux of the ensemble members with a deactivated flux is 0
+                np.copyto(R_out,0,where=np.logical_not(np.reshape(np.asarray(Activation,dtype=bool),(-1,1))))
         else:
             if Activation==False:
-                R_out=np.zeros(len(Vars.Lat))
+                R_out=0
             else:
-                R_out=-(grey*sig*Vars.T**4)
+                R_out=flux_up._planck(grey*sig)
                 
-        if builtins.Runtime_Tracker % (4*builtins.data_readout) == 0:    #Only on 4th step (due to rk4)
-            Vars.Read['Rup'][int(builtins.Runtime_Tracker/(4*builtins.data_readout))]=R_out
+        if builtins.Runtime_Tracker % builtins.readout_period == 0:    #Only on 4th step (due to rk4)
+            readout('Rup',R_out)
         return R_out
 
     def sellers(self,funcparam):
@@ -871,29 +847,45 @@ class flux_up:
         """
         #Outgoing radiation, from Sellers earth-atmosphere model
         #R_outselparam=[sig,grey,gamma,m]"""
-        list_parameters=list(funcparam.values())
-        Activation,m,sigma,gamma,k=list_parameters
+        Activation,m,sigma,gamma,k=funcparam.values()
         if builtins.parallelization==True:
-            paras=[m,sigma,gamma,k]
-            m,sigma,gamma,k=[np.transpose(np.array([paras[i]]*len(Vars.Lat))) if np.shape(paras[i])==(builtins.number_of_parallels,) else paras[i] for i in range(len(paras))]
-            if type(Activation)==bool:
-                R_out=-k*sigma*Vars.T**4*(1-m*np.tanh(gamma*Vars.T**6))
-            else:
-                R_out=np.reshape(np.zeros(builtins.number_of_parallels*len(Vars.Lat)),(builtins.number_of_parallels,len(Vars.Lat)))
-                for i in range(builtins.number_of_parallels):
-                    if Activation[i]==False:
-                        R_out[i]=np.zeros(len(Vars.Lat))
-                    else:
-                        R_out[i]=-k*sigma*Vars.T[i]**4*(1-m*np.tanh(gamma*Vars.T[i]**6))
+            m,sigma,gamma,k=parallel_columns(m,sigma,gamma,k)
+            R_out=flux_up._sellers(m,sigma,gamma,k)
+            if type(Activation)!=bool:
+                #the flux of the ensemble members with a deactivated flux is 0
+                np.copyto(R_out,0,where=np.logical_not(np.reshape(np.asarray(Activation,dtype=bool),(-1,1))))
         else:
             if Activation==False:
-                R_out=np.zeros(len(Vars.Lat))
+                R_out=0
             else:
-                R_out=-k*sigma*Vars.T**4*(1-m*np.tanh(gamma*Vars.T**6))
-        if builtins.Runtime_Tracker % (4*builtins.data_readout) == 0:    #Only on 4th step (due to rk4)
-            Vars.Read['Rup'][int(builtins.Runtime_Tracker/(4*builtins.data_readout))]=R_out
+                R_out=flux_up._sellers(m,sigma,gamma,k)
+        if builtins.Runtime_Tracker % builtins.readout_period == 0:    #Only on 4th step (due to rk4)
+            readout('Rup',R_out)
         return R_out
 
+    @staticmethod
+    def _planck(emissivity):
+        #R_out=-grey*sigma*T**4 evaluated in the preallocated work arrays, with T**4 as (T*T)*(T*T)
+        #instead of a call to pow per element
+        T2=np.multiply(Vars.T,Vars.T,out=work_array('T2'))
+        R_out=np.multiply(T2,T2,out=work_array('Rup'))
+        return np.multiply(R_out,-emissivity,out=R_out)
+
+    @staticmethod
+    def _sellers(m,sigma,gamma,k):
+        #R_out=-k*sigma*T**4*(1-m*tanh(gamma*T**6)) evaluated in the preallocated work arrays,
+        #with T**4 and T**6 built from one T**2 instead of two calls to pow and the scalar factors
+        #folded into T**4*(k*sigma*m*tanh(gamma*T**6)-k*sigma)
+        T2=np.multiply(Vars.T,Vars.T,out=work_array('T2'))
+        R_out=np.multiply(T2,T2,out=work_array('Rup'))
+        cloud=np.multiply(R_out,T2,out=T2)
+        np.multiply(cloud,gamma,out=cloud)
+        np.tanh(cloud,out=cloud)
+        ksigma=k*sigma
+        np.multiply(cloud,ksigma*m,out=cloud)
+        np.subtract(cloud,ksigma,out=cloud)
+        return np.multiply(R_out,cloud,out=R_out)
+
 class transfer:
     """ 
     Class defining latitudinal energy transfer transfer fluxes.
@@ -960,16 +952,20 @@ class transfer:
         """
         #Diffusive transfer flow by Budyko
         #A_budpama=[beta]
-        list_parameters=list(funcparam.values())
-        beta,Read,Activated=list_parameters
+        beta,Read,Activated=funcparam.values()
         if Activated==True: #with activation statement
-            F=beta*(Vars.T_global-Vars.T)        
+            T_global=Vars.T_global
+            if builtins.parallelization==True:
+                #One row per ensemble member, the global means and parameters are broadcasted along the latitudes
+                T_global=np.reshape(T_global,(-1,1))
+                beta,=parallel_columns(beta)
+            F=np.subtract(T_global,Vars.T,out=work_array('BudTransfer'))
+            np.multiply(F,beta,out=F)
         else:
             F=0
         #Reading the distribution to give an output
-        if Read==True:
-            if builtins.Runtime_Tracker % (4*builtins.data_readout) == 0:
-                Vars.Read['BudTransfer'][int(builtins.Runtime_Tracker/(4*builtins.data_readout))]=F
+        if Read==True and builtins.Runtime_Tracker % builtins.readout_period == 0:
+            readout('BudTransfer',F)
         return F
 
     def sellers(self,funcparam):
@@ -1161,17 +1157,16 @@ class transfer:
         #Transfer_Sel=WV_Sel+SH_airSel+SH_oceanSel
         #Transfer_Selparam=[K_wv,g,a,eps,p,e0,L,Rd,dy,dp,K_h,cp,K_o,dz,l_cover,re]
                                                                                                                                                             
-        list_parameters=list(funcparam.values())
-        Readout,Activated,K_wv,K_h,K_o,g,a,eps,p,e0,L,Rd,dy,dp     ,cp,dz,l_cover,re,cp_w,dens_w,factor_wv,factor_air,factor_oc,factor_kwv,factor_kair=list_parameters
+        Readout,Activated,K_wv,K_h,K_o,g,a,eps,p,e0,L,Rd,dy,dp     ,cp,dz,l_cover,re,cp_w,dens_w,factor_wv,factor_air,factor_oc,factor_kwv,factor_kair=funcparam.values()
         """if builtins.parallelization==True:
             paras=[K_wv,K_h,K_o,g,a,eps,p,e0,L,Rd,dy,dp,cp,dz,l_cover,re,cp_w,dens_w,factor_wv,factor_air,factor_oc,factor_kwv,factor_kair]
             K_wv,K_h,K_o,g,a,eps,p,e0,L,Rd,dy,dp,cp,dz,l_cover,re,cp_w,dens_w,factor_wv,factor_air,factor_oc,factor_kwv,factor_kair=\
                 [xr.DataArray(paras[i],coords=[np.arange(builtins.number_of_parallels)],dims=['parallel']) if np.shape(paras[i])==(builtins.number_of_parallels,) else xr.DataArray(paras[i],coords=[Vars.Lat],dims=['lat']) if np.shape(paras[i])==(len(Vars.Lat),) else xr.DataArray(paras[i],coords=[Vars.Lat2],dims=['lat2']) if np.shape(paras[i])==(len(Vars.Lat2),) else xr.DataArray(paras[i],coords=[np.arange(builtins.number_of_parallels),Vars.Lat],dims=['parallel','lat']) if np.shape(paras[i])==(builtins.number_of_parallels,len(Vars.Lat)) else paras[i] for i in range(len(paras))]
               """               
         if builtins.parallelization==True:
-            paras=[K_wv,K_h,K_o,g,a,eps,p,e0,L,Rd,dy,dp,cp,dz,l_cover,re,cp_w,dens_w,factor_wv,factor_air,factor_oc,factor_kwv,factor_kair]
+            #parameters given per ensemble member are reshaped to columns, which broadcast along the circles
             K_wv,K_h,K_o,g,a,eps,p,e0,L,Rd,dy,dp,cp,dz,l_cover,re,cp_w,dens_w,factor_wv,factor_air,factor_oc,factor_kwv,factor_kair=\
-                [np.transpose(np.array([paras[i]]*len(Vars.Lat2))) if np.shape(paras[i])==(builtins.number_of_parallels,) else paras[i] for i in range(len(paras))]
+                parallel_columns(K_wv,K_h,K_o,g,a,eps,p,e0,L,Rd,dy,dp,cp,dz,l_cover,re,cp_w,dens_w,factor_wv,factor_air,factor_oc,factor_kwv,factor_kair)
 
         if Activated==True:
             #Parameters for different transfer Fluxes+their calculation 
@@ -1190,43 +1185,41 @@ class transfer:
             cL=transfer().watervapour_sel(WV_Selparam)
             C=transfer().sensibleheat_air_sel(SH_airSelparam)
             F=transfer().sensibleheat_ocean_sel(SH_oceanSelparam)
-            P=cL+C+F  
+            P=np.add(cL,C,out=work_array('P',np.shape(cL)))
+            np.add(P,F,out=P)
 
-            #calculation of gridparameters (for 1st step only)
-            if builtins.Runtime_Tracker==0:
-                Vars.latlength=earthsystem().length_latitudes(re)
-                Vars.area=earthsystem().area_latitudes(re)
+            #gridparameters, only recomputed by earthsystem.init_grid if the grid or the radius changed
+            earthsystem().init_grid(re)
                 
-            #Converting Arrays to two arrays with an one element shift
-            #Apply builtins.parallelization if activated
-            if builtins.parallelization==True: 
-                P1,P0=np.reshape(np.zeros(builtins.number_of_parallels*len(Vars.Lat)*2),(2,builtins.number_of_parallels,len(Vars.Lat)))
-                for i in range(builtins.number_of_parallels):
-                    P_0=np.append(P[i],0)                    
-                    P_1=np.insert(P[i],0,0) 
-                    P0[i]=P_0
-                    P1[i]=P_1            
-            else:
-                P0=np.append(P,0)                       
-                P1=np.insert(P,0,0)
-            l0=np.append(Vars.latlength,0)
-            l1=np.insert(Vars.latlength,0,0)
-            
             #resulting latitudinal transfer flow, weighted with the gridparameters
-            Transfer=(P1*l1-P0*l0)/Vars.area
+            #(the one element shift acts on the last axis, for single and parallelized runs)
+            Transfer=transfer._divergence(P)
             
 
             #reading for output
-            if Readout==True:
-                if builtins.Runtime_Tracker % (4*builtins.data_readout) == 0:
-                    Readdata=[cL,C,F,P,Transfer]
-                    Readdatakeys=['cL','C','F','P','Transfer']
-                    for l in range(len(Readdata)):
-                        Vars.Read[Readdatakeys[l]][int(builtins.Runtime_Tracker/(4*builtins.data_readout))]=Readdata[l]
+            if Readout==True and builtins.Runtime_Tracker % builtins.readout_period == 0:
+                readout('cL',cL)
+                readout('C',C)
+                readout('F',F)
+                readout('P',P)
+                readout('Transfer',Transfer)
         else:
             Transfer=0
         return Transfer
 
+    @staticmethod
+    def _divergence(P):
+        #Transfer=(P1*l1-P0*l0)/area with P1, P0 (l1, l0) the one element shifted P (latlength),
+        #evaluated by slicing into the preallocated output instead of building the shifted copies.
+        #The grid weights l/area are precomputed, so no division is left per call
+        w_north,w_south=Vars.transfer_weights
+        Transfer=work_array('Transfer')
+        Transfer[...,0]=0
+        np.multiply(P,w_north,out=Transfer[...,1:])
+        Pl=np.multiply(P,w_south,out=work_array('Pl',np.shape(P)))
+        Transfer[...,:-1]-=Pl
+        return Transfer
+
     def watervapour_sel(self,funcparam):
         """ 
         The energy transfer flux through watervapour used in ``transfer().sellers``.
@@ -1321,16 +1314,13 @@ class transfer:
         K_wv,g,eps,p,e0,L,Rd,dy,dp,factor_wv,factor_kwv=funcparam
         
         #calculating the specific humidity q and its latitudinal difference dq
-        q=earthsystem().specific_saturation_humidity_sel(e0,eps,L,Rd,p)
-        dq=earthsystem().humidity_difference(e0,eps,L,Rd,p)
-        if builtins.parallelization==True:
-        #equation of the water vapour energy transfer
-            a1=Vars.meridional*q
-            a2=K_wv*factor_kwv*dq/dy
-            a3=dp*const.mb_to_Pa/g
-            cL=L*(a1-a2)*a3*factor_wv
-        else:
-            cL=L*(Vars.meridional*q-K_wv*factor_kwv*dq/dy)*(dp*const.mb_to_Pa/g)*factor_wv
+        q,dq=earthsystem._humidity(e0,eps,L,Rd,p)
+        #equation of the water vapour energy transfer (the parameters are grouped, so that only
+        #the terms with q and dq are evaluated on the whole grid, into a preallocated array)
+        cL=np.multiply(Vars.meridional,q,out=work_array('cL',np.shape(Vars.tempdif)))
+        dq*=K_wv*factor_kwv/dy
+        cL-=dq
+        cL*=L*dp*const.mb_to_Pa/g*factor_wv
         return cL
 
     def sensibleheat_air_sel(self,funcparam):
@@ -1402,13 +1392,9 @@ class transfer:
         K_h,g,dy,cp,dp,factor_air,factor_kair=funcparam
         
         #equation of the atmosphere sensible heat transfer, with dependence on Temperature and Temperature difference
-        if builtins.parallelization==True:
-            a1=Vars.meridional*Vars.T[:,1:]
-            a2=K_h*factor_kair*Vars.tempdif/dy
-            a3=cp*dp*const.mb_to_Pa/g
-            C=(a1-a2)*a3*factor_air
-        else:
-            C=(Vars.meridional*Vars.T[1:]-K_h*factor_kair*(Vars.tempdif/(dy)))*(cp*dp*const.mb_to_Pa/g)*factor_air
+        C=np.multiply(Vars.meridional,Vars.T[...,1:],out=work_array('C',np.shape(Vars.tempdif)))
+        C-=Vars.tempdif*(K_h*factor_kair/dy)
+        C*=cp*dp*const.mb_to_Pa/g*factor_air
         return C
         
     def sensibleheat_ocean_sel(self,funcparam):
@@ -1474,10 +1460,7 @@ class transfer:
         K_o,dz,l_cover,dy,cp_w,dens_w,factor_oc=funcparam
         
         #equation of ocean sensible heat transfer
-        if builtins.parallelization==True:
-            F=-K_o*dz*l_cover*Vars.tempdif/dy*cp_w*dens_w*factor_oc
-        else:
-            F=-K_o*dz*l_cover*Vars.tempdif/(dy)*cp_w*dens_w*factor_oc
+        F=np.multiply(Vars.tempdif,-K_o*dz*l_cover/dy*cp_w*dens_w*factor_oc,out=work_array('F',np.shape(Vars.tempdif)))
         return F
 
 class forcing:
@@ -1496,8 +1479,7 @@ class forcing:
     
     """
     def offset(self,funcparam):
-        list_parameters=list(funcparam.values())
-        F1,F2,F3,F4,F5,F6,F7,F8,F9,F10,F11,F12,F13,F14,F15,F16,F17,F18,Correction_Latitudes=list_parameters
+        F1,F2,F3,F4,F5,F6,F7,F8,F9,F10,F11,F12,F13,F14,F15,F16,F17,F18,Correction_Latitudes=funcparam.values()
         paras=[F1,F2,F3,F4,F5,F6,F7,F8,F9,F10,F11,F12,F13,F14,F15,F16,F17,F18]
         
         
@@ -1610,27 +1592,15 @@ class forcing:
         :rtype:                     float
 
         """
-        list_parameters=list(funcparam.values())
-        forcingnumber,start,stop,steps,timeunit,strength,frequency,behaviour,lifetime,seed,sign=list_parameters
+        forcingnumber,start,stop,steps,timeunit,strength,frequency,behaviour,lifetime,seed,sign=funcparam.values()
         if builtins.Runtime_Tracker==0:
             random_events_time=np.arange(start,stop+steps,steps)
 
             #if BP==True:
             #    random_events_time=-(lna(random_events_time)-start)
-            if timeunit=='minute':
-                random_events_time=lna(random_events_time)*60
-            if timeunit=='hour':
-                random_events_time=lna(random_events_time)*60*60
-            if timeunit=='day':
-                random_events_time=lna(random_events_time)*60*60*24
-            if timeunit=='week':
-                random_events_time=lna(random_events_time)*60*60*24*7
-            if timeunit=='month':
-                random_events_time=lna(random_events_time)*60*60*24*365/12
-            if timeunit=='year':
-                random_events_time=lna(random_events_time)*60*60*24*365
-
-            random_events=[0]*len(random_events_time)
+            random_events_time=random_events_time*const.time_sec_unit.get(timeunit,1)
+
+            random_events=np.zeros(len(random_events_time))
             i=0
             np.random.seed(seed)
             if frequency=='common':
@@ -1645,39 +1615,27 @@ class forcing:
             if frequency=='superrare':
                 freqmin=np.abs(start-stop)/steps*30/100
                 freqmax=np.abs(start-stop)/steps*60/100
-            
+            #decay of an exponential event over its lifetime, shared by all events
+            decay=np.exp(-np.arange(int(lifetime*4))/lifetime)
+
             while i<len(random_events):
                 current_event=np.random.uniform(0,strength)
-                #random_events[i]=current_event
-                
+                #the event is written over its lifetime at once (slices are cut at the end of the record),
+                #the random draws stay in the same order so that a seed reproduces the same events
                 if behaviour=='step':
-                    for k in range(int(lifetime)):
-                        if i+k==len(random_events):
-                            break
-                        random_events[i+k]=current_event
+                    random_events[i:i+int(lifetime)]=current_event
                 if behaviour=='exponential':
-                    for k in range(int(lifetime*4)):
-                        if i+k==len(random_events):
-                            break
-                        random_events[i+k]=current_event*np.exp(-k/lifetime)
+                    event=random_events[i:i+len(decay)]
+                    np.multiply(decay[:len(event)],current_event,out=event)
                         
                 next_event=np.random.randint(freqmin,freqmax)
                 i=i+next_event
             if sign=='negative':
-                Vars.ExternalInput[forcingnumber]=[random_events_time,-lna(random_events)]
+                Vars.ExternalInput[forcingnumber]=[random_events_time,-random_events]
             elif sign=='positive':
-                Vars.ExternalInput[forcingnumber]=[random_events_time,lna(random_events)]
+                Vars.ExternalInput[forcingnumber]=[random_events_time,random_events]
 
-        while Vars.t>Vars.ExternalInput[forcingnumber][0][Vars.ForcingTracker[forcingnumber][0]]:
-            if Vars.ForcingTracker[forcingnumber][0]==(len(Vars.ExternalInput[forcingnumber][0])-1):
-                Vars.ForcingTracker[forcingnumber][1]=0
-                break
-            else:
-                Vars.ForcingTracker[forcingnumber][1] = Vars.ExternalInput[forcingnumber][1][Vars.ForcingTracker[forcingnumber][0]]
-                Vars.ForcingTracker[forcingnumber][0] += 1
-        F=Vars.ForcingTracker[forcingnumber][1]
-        if builtins.Runtime_Tracker % (4*builtins.data_readout) == 0:
-            Vars.ExternalOutput[forcingnumber][int(builtins.Runtime_Tracker/(4*builtins.data_readout))]=F
+        F=advance_forcing(Vars.ForcingTracker[forcingnumber],Vars.ExternalInput[forcingnumber][0],Vars.ExternalInput[forcingnumber][1],0,Vars.ExternalOutput[forcingnumber])
         return F
 
     def predefined(self,funcparam):
@@ -1762,39 +1720,19 @@ class forcing:
         :rtype:                     float
 
         """
-        list_parameters=list(funcparam.values())
-        forcingnumber,datapath,name,delimiter,header,footer,col_time,col_forcing,timeunit,BP,time_start,k_output, m_output, k_input, m_input=list_parameters
+        forcingnumber,datapath,name,delimiter,header,footer,col_time,col_forcing,timeunit,BP,time_start,k_output, m_output, k_input, m_input=funcparam.values()
         if builtins.Runtime_Tracker==0:
-            Vars.ExternalInput[forcingnumber]=np.genfromtxt(str(datapath)+str(name),delimiter=str(delimiter),skip_header=header,skip_footer=footer,usecols=(col_time,col_forcing),unpack=True,encoding='ISO-8859-1')  
+            Vars.ExternalInput[forcingnumber]=read_data(str(datapath)+str(name),delimiter=str(delimiter),skip_header=header,skip_footer=footer,usecols=(col_time,col_forcing),unpack=True)  
             Vars.External_time_start[forcingnumber]=time_start   
-            Vars.ExternalInput[forcingnumber][1]=lna(Vars.ExternalInput[forcingnumber][1])*k_input+m_input
+            Vars.ExternalInput[forcingnumber][1]*=k_input
+            Vars.ExternalInput[forcingnumber][1]+=m_input
             if BP==True:
-                Vars.ExternalInput[forcingnumber][0]=-(lna(Vars.ExternalInput[forcingnumber][0])-Vars.External_time_start[forcingnumber])
+                np.subtract(Vars.External_time_start[forcingnumber],Vars.ExternalInput[forcingnumber][0],out=Vars.ExternalInput[forcingnumber][0])
             if BP==False:
-                Vars.ExternalInput[forcingnumber][0]=lna(Vars.ExternalInput[forcingnumber][0])+Vars.External_time_start[forcingnumber]
-            if timeunit=='minute':
-                Vars.ExternalInput[forcingnumber][0]=lna(Vars.ExternalInput[forcingnumber][0])*60
-            if timeunit=='hour':
-                Vars.ExternalInput[forcingnumber][0]=lna(Vars.ExternalInput[forcingnumber][0])*60*60
-            if timeunit=='day':
-                Vars.ExternalInput[forcingnumber][0]=lna(Vars.ExternalInput[forcingnumber][0])*60*60*24
-            if timeunit=='week':
-                Vars.ExternalInput[forcingnumber][0]=lna(Vars.ExternalInput[forcingnumber][0])*60*60*24*7
-            if timeunit=='month':
-                Vars.ExternalInput[forcingnumber][0]=lna(Vars.ExternalInput[forcingnumber][0])*60*60*24*365/12
-            if timeunit=='year':
-                Vars.ExternalInput[forcingnumber][0]=lna(Vars.ExternalInput[forcingnumber][0])*60*60*24*365
-        
-        while Vars.t>Vars.ExternalInput[forcingnumber][0][Vars.ForcingTracker[forcingnumber][0]]:
-            if Vars.ForcingTracker[forcingnumber][0]==(len(Vars.ExternalInput[forcingnumber][0])-1):
-                Vars.ForcingTracker[forcingnumber][1]=0
-                break
-            else:
-                Vars.ForcingTracker[forcingnumber][1] = Vars.ExternalInput[forcingnumber][1][Vars.ForcingTracker[forcingnumber][0]]
-                Vars.ForcingTracker[forcingnumber][0] += 1
-        F=Vars.ForcingTracker[forcingnumber][1]*k_output+m_output
-        if builtins.Runtime_Tracker % (4*builtins.data_readout) == 0:
-            Vars.ExternalOutput[forcingnumber][int(builtins.Runtime_Tracker/(4*builtins.data_readout))]=F
+                Vars.ExternalInput[forcingnumber][0]+=Vars.External_time_start[forcingnumber]
+            Vars.ExternalInput[forcingnumber][0]*=const.time_sec_unit.get(timeunit,1)
+        
+        F=advance_forcing(Vars.ForcingTracker[forcingnumber],Vars.ExternalInput[forcingnumber][0],Vars.ExternalInput[forcingnumber][1],0,Vars.ExternalOutput[forcingnumber],k_output,m_output)
         return F
 
     def predefined1d(self,funcparam):
@@ -1879,45 +1817,26 @@ class forcing:
         :rtype:                     float
 
         """
-        list_parameters=list(funcparam.values())
-        forcingnumber,datapath,name,delimiter,header,footer,col_time,colrange_forcing,timeunit,BP,time_start,k_output, m_output, k_input, m_input=list_parameters
+        forcingnumber,datapath,name,delimiter,header,footer,col_time,colrange_forcing,timeunit,BP,time_start,k_output, m_output, k_input, m_input=funcparam.values()
         if builtins.Runtime_Tracker==0:
             forcingscols=np.arange(colrange_forcing[0],colrange_forcing[1],dtype=int)
 
             Vars.ExternalInput[forcingnumber]=[0,0]
-            Vars.ExternalInput[forcingnumber][0]=np.genfromtxt(str(datapath)+str(name),delimiter=str(delimiter),skip_header=header,skip_footer=footer,usecols=(col_time),unpack=True,encoding='ISO-8859-1') 
-            Vars.ExternalInput[forcingnumber][1]=np.transpose(np.genfromtxt(str(datapath)+str(name),delimiter=str(delimiter),skip_header=header,usecols=forcingscols,unpack=True,encoding='ISO-8859-1'))  
+            Vars.ExternalInput[forcingnumber][0]=read_data(str(datapath)+str(name),delimiter=str(delimiter),skip_header=header,skip_footer=footer,usecols=(col_time),unpack=True) 
+            Vars.ExternalInput[forcingnumber][1]=np.transpose(read_data(str(datapath)+str(name),delimiter=str(delimiter),skip_header=header,usecols=forcingscols,unpack=True))  
 
             Vars.External_time_start[forcingnumber]=time_start   
-            Vars.ExternalInput[forcingnumber][1]=lna(Vars.ExternalInput[forcingnumber][1])*k_input+m_input
+            Vars.ExternalInput[forcingnumber][1]*=k_input
+            Vars.ExternalInput[forcingnumber][1]+=m_input
             if BP==True:
-                Vars.ExternalInput[forcingnumber][0]=-(lna(Vars.ExternalInput[forcingnumber][0])-Vars.External_time_start[forcingnumber])
+                np.subtract(Vars.External_time_start[forcingnumber],Vars.ExternalInput[forcingnumber][0],out=Vars.ExternalInput[forcingnumber][0])
             if BP==False:
-                Vars.ExternalInput[forcingnumber][0]=lna(Vars.ExternalInput[forcingnumber][0])+Vars.External_time_start[forcingnumber]
-            if timeunit=='minute':
-                Vars.ExternalInput[forcingnumber][0]=lna(Vars.ExternalInput[forcingnumber][0])*60
-            if timeunit=='hour':
-                Vars.ExternalInput[forcingnumber][0]=lna(Vars.ExternalInput[forcingnumber][0])*60*60
-            if timeunit=='day':
-                Vars.ExternalInput[forcingnumber][0]=lna(Vars.ExternalInput[forcingnumber][0])*60*60*24
-            if timeunit=='week':
-                Vars.ExternalInput[forcingnumber][0]=lna(Vars.ExternalInput[forcingnumber][0])*60*60*24*7
-            if timeunit=='month':
-                Vars.ExternalInput[forcingnumber][0]=lna(Vars.ExternalInput[forcingnumber][0])*60*60*24*365/12
-            if timeunit=='year':
-                Vars.ExternalInput[forcingnumber][0]=lna(Vars.ExternalInput[forcingnumber][0])*60*60*24*365
+                Vars.ExternalInput[forcingnumber][0]+=Vars.External_time_start[forcingnumber]
+            Vars.ExternalInput[forcingnumber][0]*=const.time_sec_unit.get(timeunit,1)
             Vars.ForcingTracker[forcingnumber][1]=np.zeros(len(Vars.Lat))
-        while Vars.t>Vars.ExternalInput[forcingnumber][0][Vars.ForcingTracker[forcingnumber][0]]:
-            if Vars.ForcingTracker[forcingnumber][0]==(len(Vars.ExternalInput[forcingnumber][0])-1):
-                Vars.ForcingTracker[forcingnumber][1]=np.zeros(len(Vars.Lat))
-
-                break
-            else:
-                Vars.ForcingTracker[forcingnumber][1] = Vars.ExternalInput[forcingnumber][1][Vars.ForcingTracker[forcingnumber][0]]
-                Vars.ForcingTracker[forcingnumber][0] += 1
-        F=Vars.ForcingTracker[forcingnumber][1]*k_output+m_output
-        if builtins.Runtime_Tracker % (4*builtins.data_readout) == 0:
-            Vars.ExternalOutput[forcingnumber][int(builtins.Runtime_Tracker/(4*builtins.data_readout))]=F
+            #the zero forcing after the end of the record, created once instead of per call
+            Vars.ExternalInput[forcingnumber].append(np.zeros(len(Vars.Lat)))
+        F=advance_forcing(Vars.ForcingTracker[forcingnumber],Vars.ExternalInput[forcingnumber][0],Vars.ExternalInput[forcingnumber][1],Vars.ExternalInput[forcingnumber][2],Vars.ExternalOutput[forcingnumber],k_output,m_output)
         return F
 
     def co2_myhre(self,funcparam):
@@ -2021,43 +1940,30 @@ class forcing:
         :rtype:                     float
 
         """
-        list_parameters=list(funcparam.values())
-        A,C_0,CO2_base,datapath,name,delimiter,header,footer,col_time,col_conc,timeunit,BP,time_start=list_parameters
+        A,C_0,CO2_base,datapath,name,delimiter,header,footer,col_time,col_conc,timeunit,BP,time_start=funcparam.values()
         if builtins.Runtime_Tracker==0:
-            Vars.CO2Input=np.genfromtxt(str(datapath)+str(name),delimiter=str(delimiter),skip_header=header,skip_footer=footer,usecols=(col_time,col_conc),unpack=True,encoding='ISO-8859-1')  
+            Vars.CO2Input=read_data(str(datapath)+str(name),delimiter=str(delimiter),skip_header=header,skip_footer=footer,usecols=(col_time,col_conc),unpack=True)  
             Vars.CO2_time_start=time_start    
             if BP==True:
-                Vars.CO2Input[0]=-(lna(Vars.CO2Input[0])-Vars.CO2_time_start)
+                np.subtract(Vars.CO2_time_start,Vars.CO2Input[0],out=Vars.CO2Input[0])
             if BP==False:
-                Vars.CO2Input[0]=lna(Vars.CO2Input[0])+Vars.CO2_time_start
-            if timeunit=='minute':
-                Vars.CO2Input[0]=lna(Vars.CO2Input[0])*60
-            if timeunit=='hour':
-                Vars.CO2Input[0]=lna(Vars.CO2Input[0])*60*60
-            if timeunit=='day':
-                Vars.CO2Input[0]=lna(Vars.CO2Input[0])*60*60*24
-            if timeunit=='week':
-                Vars.CO2Input[0]=lna(Vars.CO2Input[0])*60*60*24*7
-            if timeunit=='month':
-                Vars.CO2Input[0]=lna(Vars.CO2Input[0])*60*60*24*365/12
-            if timeunit=='year':
-                Vars.CO2Input[0]=lna(Vars.CO2Input[0])*60*60*24*365
+                Vars.CO2Input[0]+=Vars.CO2_time_start
+            Vars.CO2Input[0]*=const.time_sec_unit.get(timeunit,1)
             
             if Vars.CO2Input[0][0]>Vars.CO2Input[0][1]:
                 Vars.CO2Input[0]=np.flip(Vars.CO2Input[0],axis=0)
                 Vars.CO2Input[1]=np.flip(Vars.CO2Input[1],axis=0)
             Vars.CO2Tracker[1]=A*(np.log(CO2_base/C_0))
-        while Vars.t>Vars.CO2Input[0][Vars.CO2Tracker[0]]:
-            if Vars.CO2Tracker[0]==(len(Vars.CO2Input[0])-1):
-                Vars.CO2Tracker[1]=A*(np.log(CO2_base/C_0))
-                break
-            else:
-                
-                Vars.CO2Tracker[1] = A*(np.log(Vars.CO2Input[1][Vars.CO2Tracker[0]]/C_0))
-                Vars.CO2Tracker[0] += 1
+        i=forcing_index(Vars.CO2Input[0],Vars.CO2Tracker[0])
+        if i==len(Vars.CO2Input[0]):
+            Vars.CO2Tracker[0]=len(Vars.CO2Input[0])-1
+            Vars.CO2Tracker[1]=A*(np.log(CO2_base/C_0))
+        elif i>Vars.CO2Tracker[0]:
+            Vars.CO2Tracker[1]=A*(np.log(Vars.CO2Input[1][i-1]/C_0))
+            Vars.CO2Tracker[0]=i
         F=Vars.CO2Tracker[1]
-        if builtins.Runtime_Tracker % (4*builtins.data_readout) == 0:
-            Vars.CO2Output[int(builtins.Runtime_Tracker/(4*builtins.data_readout))]=F
+        if builtins.Runtime_Tracker % builtins.readout_period == 0:
+            Vars.CO2Output[builtins.Runtime_Tracker//builtins.readout_period]=F
         return F
 
     def orbital(self,funcparam):
@@ -2142,42 +2048,29 @@ class forcing:
         :rtype:                     float
 
         """
-        list_parameters=list(funcparam.values())
-        datapath,name,delimiter,header,footer,col_time,col_ecc,col_per,col_obl,timeunit,BP,time_start,initial,perishift=list_parameters
+        datapath,name,delimiter,header,footer,col_time,col_ecc,col_per,col_obl,timeunit,BP,time_start,initial,perishift=funcparam.values()
 
         if builtins.Runtime_Tracker==0:
-            Vars.ExternalOrbitals=np.genfromtxt(str(datapath)+str(name),delimiter=str(delimiter),skip_header=header,skip_footer=footer,usecols=(col_time,col_ecc,col_per,col_obl),unpack=True,encoding='ISO-8859-1')  
+            Vars.ExternalOrbitals=read_data(str(datapath)+str(name),delimiter=str(delimiter),skip_header=header,skip_footer=footer,usecols=(col_time,col_ecc,col_per,col_obl),unpack=True)  
             Vars.External_time_start=time_start   
  
             if BP==True:
-                Vars.ExternalOrbitals[0]=-(lna(Vars.ExternalOrbitals[0])-Vars.External_time_start)
+                np.subtract(Vars.External_time_start,Vars.ExternalOrbitals[0],out=Vars.ExternalOrbitals[0])
             if BP==False:
-                Vars.ExternalOrbitals[0]=lna(Vars.ExternalOrbitals[0])+Vars.External_time_start
-            if timeunit=='minute':
-                Vars.ExternalOrbitals[0]=lna(Vars.ExternalOrbitals[0])*60
-            if timeunit=='hour':
-                Vars.ExternalOrbitals[0]=lna(Vars.ExternalOrbitals[0])*60*60
-            if timeunit=='day':
-                Vars.ExternalOrbitals[0]=lna(Vars.ExternalOrbitals[0])*60*60*24
-            if timeunit=='week':
-                Vars.ExternalOrbitals[0]=lna(Vars.ExternalOrbitals[0])*60*60*24*7
-            if timeunit=='month':
-                Vars.ExternalOrbitals[0]=lna(Vars.ExternalOrbitals[0])*60*60*24*365/12
-            if timeunit=='year':
-                Vars.ExternalOrbitals[0]=lna(Vars.ExternalOrbitals[0])*60*60*24*365
+                Vars.ExternalOrbitals[0]+=Vars.External_time_start
+            Vars.ExternalOrbitals[0]*=const.time_sec_unit.get(timeunit,1)
             
             if Vars.ExternalOrbitals[0][0]>Vars.ExternalOrbitals[0][1]:
                 Vars.ExternalOrbitals[0]=np.flip(Vars.ExternalOrbitals[0],axis=0)
                 Vars.ExternalOrbitals[1]=np.flip(Vars.ExternalOrbitals[1],axis=0)
             Vars.OrbitalTracker[1]=initial
-        while Vars.t>Vars.ExternalOrbitals[0][Vars.OrbitalTracker[0]]:
-            if Vars.OrbitalTracker[0]==(len(Vars.ExternalOrbitals[0])-1):
-                Vars.OrbitalTracker[1]={'ecc':Vars.ExternalOrbitals[1][-1] ,'long_peri': Vars.ExternalOrbitals[2][-1]+perishift, 'obliquity': Vars.ExternalOrbitals[3][-1]}
-                break
-            else:
-                
-                Vars.OrbitalTracker[1] = {'ecc':Vars.ExternalOrbitals[1][Vars.OrbitalTracker[0]] ,'long_peri': Vars.ExternalOrbitals[2][Vars.OrbitalTracker[0]]+perishift, 'obliquity': Vars.ExternalOrbitals[3][Vars.OrbitalTracker[0]]}
-                Vars.OrbitalTracker[0] += 1
+        i=forcing_index(Vars.ExternalOrbitals[0],Vars.OrbitalTracker[0])
+        if i==len(Vars.ExternalOrbitals[0]):
+            Vars.OrbitalTracker[0]=len(Vars.ExternalOrbitals[0])-1
+            Vars.OrbitalTracker[1]={'ecc':Vars.ExternalOrbitals[1][-1] ,'long_peri': Vars.ExternalOrbitals[2][-1]+perishift, 'obliquity': Vars.ExternalOrbitals[3][-1]}
+        elif i>Vars.OrbitalTracker[0]:
+            Vars.OrbitalTracker[1]={'ecc':Vars.ExternalOrbitals[1][i-1] ,'long_peri': Vars.ExternalOrbitals[2][i-1]+perishift, 'obliquity': Vars.ExternalOrbitals[3][i-1]}
+            Vars.OrbitalTracker[0]=i
 
         Vars.orbitals=Vars.OrbitalTracker[1]
 
@@ -2265,41 +2158,21 @@ class forcing:
         :rtype:                     float
 
         """
-        list_parameters=list(funcparam.values())
-        datapath,name,delimiter,header,footer,col_time,col_forcing,timeunit,BP,time_start,k_output, m_output, k_input, m_input=list_parameters
+        datapath,name,delimiter,header,footer,col_time,col_forcing,timeunit,BP,time_start,k_output, m_output, k_input, m_input=funcparam.values()
         if builtins.Runtime_Tracker==0:
-            Vars.SolarInput=np.genfromtxt(str(datapath)+str(name),delimiter=str(delimiter),skip_header=header,skip_footer=footer,usecols=(col_time,col_forcing),unpack=True,encoding='ISO-8859-1')  
+            Vars.SolarInput=read_data(str(datapath)+str(name),delimiter=str(delimiter),skip_header=header,skip_footer=footer,usecols=(col_time,col_forcing),unpack=True)  
             Vars.Solar_time_start=time_start   
-            Vars.SolarInput[1]=lna(Vars.SolarInput[1])*k_input+m_input
+            Vars.SolarInput[1]*=k_input
+            Vars.SolarInput[1]+=m_input
             if BP==True:
-                Vars.SolarInput[0]=-(lna(Vars.SolarInput[0])-Vars.Solar_time_start)
+                np.subtract(Vars.Solar_time_start,Vars.SolarInput[0],out=Vars.SolarInput[0])
             if BP==False:
-                Vars.SolarInput[0]=lna(Vars.SolarInput[0])+Vars.Solar_time_start
-            if timeunit=='minute':
-                Vars.SolarInput[0]=lna(Vars.SolarInput[0])*60
-            if timeunit=='hour':
-                Vars.SolarInput[0]=lna(Vars.SolarInput[0])*60*60
-            if timeunit=='day':
-                Vars.SolarInput[0]=lna(Vars.SolarInput[0])*60*60*24
-            if timeunit=='week':
-                Vars.SolarInput[0]=lna(Vars.SolarInput[0])*60*60*24*7
-            if timeunit=='month':
-                Vars.SolarInput[0]=lna(Vars.SolarInput[0])*60*60*24*365/12
-            if timeunit=='year':
-                Vars.SolarInput[0]=lna(Vars.SolarInput[0])*60*60*24*365
+                Vars.SolarInput[0]+=Vars.Solar_time_start
+            Vars.SolarInput[0]*=const.time_sec_unit.get(timeunit,1)
                 
         if builtins.Runtime_Tracker==0:
             Vars.TSI=Vars.SolarInput[1][0]
-        while Vars.t>Vars.SolarInput[0][Vars.SolarTracker[0]]:
-            if Vars.SolarTracker[0]==(len(Vars.SolarInput[0])-1):
-                Vars.SolarTracker[1]=0
-                break
-            else:
-                Vars.SolarTracker[1] = Vars.SolarInput[1][Vars.SolarTracker[0]]
-                Vars.SolarTracker[0] += 1
-        Vars.TSI=Vars.SolarTracker[1]*k_output+m_output
-        if builtins.Runtime_Tracker % (4*builtins.data_readout) == 0:
-            Vars.SolarOutput[int(builtins.Runtime_Tracker/(4*builtins.data_readout))]=Vars.TSI
+        Vars.TSI=advance_forcing(Vars.SolarTracker,Vars.SolarInput[0],Vars.SolarInput[1],0,Vars.SolarOutput,k_output,m_output)
         return 0
 
     def aod(self,funcparam):
@@ -2384,41 +2257,21 @@ class forcing:
         :rtype:                     float
 
         """
-        list_parameters=list(funcparam.values())
-        datapath,name,delimiter,header,footer,col_time,col_forcing,timeunit,BP,time_start,k_output, m_output, k_input, m_input=list_parameters
+        datapath,name,delimiter,header,footer,col_time,col_forcing,timeunit,BP,time_start,k_output, m_output, k_input, m_input=funcparam.values()
         if builtins.Runtime_Tracker==0:
-            Vars.AODInput=np.genfromtxt(str(datapath)+str(name),delimiter=str(delimiter),skip_header=header,skip_footer=footer,usecols=(col_time,col_forcing),unpack=True,encoding='ISO-8859-1')  
+            Vars.AODInput=read_data(str(datapath)+str(name),delimiter=str(delimiter),skip_header=header,skip_footer=footer,usecols=(col_time,col_forcing),unpack=True)  
             Vars.AOD_time_start=time_start   
-            Vars.AODInput[1]=lna(Vars.AODInput[1])*k_input+m_input
+            Vars.AODInput[1]*=k_input
+            Vars.AODInput[1]+=m_input
             if BP==True:
-                Vars.AODInput[0]=-(lna(Vars.AODInput[0])-Vars.AOD_time_start)
+                np.subtract(Vars.AOD_time_start,Vars.AODInput[0],out=Vars.AODInput[0])
             if BP==False:
-                Vars.AODInput[0]=lna(Vars.AODInput[0])+Vars.AOD_time_start
-            if timeunit=='minute':
-                Vars.AODInput[0]=lna(Vars.AODInput[0])*60
-            if timeunit=='hour':
-                Vars.AODInput[0]=lna(Vars.AODInput[0])*60*60
-            if timeunit=='day':
-                Vars.AODInput[0]=lna(Vars.AODInput[0])*60*60*24
-            if timeunit=='week':
-                Vars.AODInput[0]=lna(Vars.AODInput[0])*60*60*24*7
-            if timeunit=='month':
-                Vars.AODInput[0]=lna(Vars.AODInput[0])*60*60*24*365/12
-            if timeunit=='year':
-                Vars.AODInput[0]=lna(Vars.AODInput[0])*60*60*24*365
+                Vars.AODInput[0]+=Vars.AOD_time_start
+            Vars.AODInput[0]*=const.time_sec_unit.get(timeunit,1)
                 
         if builtins.Runtime_Tracker==0:
             Vars.AOD=Vars.AODInput[1][0]
-        while Vars.t>Vars.AODInput[0][Vars.AODTracker[0]]:
-            if Vars.AODTracker[0]==(len(Vars.AODInput[0])-1):
-                Vars.AODTracker[1]=0
-                break
-            else:
-                Vars.AODTracker[1] = Vars.AODInput[1][Vars.AODTracker[0]]
-                Vars.AODTracker[0] += 1
-        Vars.AOD=Vars.AODTracker[1]*k_output+m_output
-        if builtins.Runtime_Tracker % (4*builtins.data_readout) == 0:
-            Vars.AODOutput[int(builtins.Runtime_Tracker/(4*builtins.data_readout))]=Vars.AOD
+        Vars.AOD=advance_forcing(Vars.AODTracker,Vars.AODInput[0],Vars.AODInput[1],0,Vars.AODOutput,k_output,m_output)
         return 0
 
 class earthsystem:
@@ -2439,6 +2292,7 @@ class earthsystem:
         temperature_difference_latitudes
         length_latitudes
         area_latitudes
+        init_grid
 
     """
     def globalmean_temperature(self):
@@ -2462,10 +2316,8 @@ class earthsystem:
         """
         #Returning the cosine weighted sum of the mean annual latitudal temperature 
         #as global mean annual temperature 
-        if builtins.parallelization==True:
-            GMT=np.average(Vars.T, weights=cosd(Vars.Lat),axis=1)
-        else:
-            GMT=np.average(Vars.T, weights=cosd(Vars.Lat))
+        #(the normalized weights act on the last axis, for single and parallelized runs)
+        GMT=np.dot(Vars.T,lat_weights('Lat'))
         return GMT
     
     def insolation(self,Lat_in,Days_in,orb={'ecc': 0.017236, 'long_peri': 281.37, 'obliquity': 23.446},S0=1366.14):
@@ -2549,21 +2401,27 @@ class earthsystem:
         #returning the annual mean solar insolation or solar insolations varying over time, depending on the
         #time specified
         if timeunit=='annualmean':
-            days=np.arange(365)
-            Q=lna(np.mean(earthsystem().insolation(Vars.Lat,days,Vars.orbitals,S0=Q+Vars.TSI),axis=0))
+            #the annual mean only depends on the grid, the orbital parameters and S0,
+            #it is reused as long as they are unchanged
+            S0=Q+Vars.TSI
+            key=(np.asarray(Vars.Lat).tobytes(),tuple(Vars.orbitals.items()),np.asarray(S0).tobytes())
+            if Vars.solar_cache[0]!=key:
+                days=np.arange(365)
+                Vars.solar_cache=[key,np.mean(earthsystem().insolation(Vars.Lat,days,Vars.orbitals,S0=S0),axis=0)]
+            Q=Vars.solar_cache[1]
         elif timeunit=='year':
             days=np.linspace(0,((365*int(Vars.t)-1) % 365)*builtins.stepsize_of_integration % 365,36)
-            Q=lna(np.mean(earthsystem().insolation(Vars.Lat,days,Vars.orbitals,S0=Q+Vars.TSI),axis=0))*convfactor
+            Q=np.mean(earthsystem().insolation(Vars.Lat,days,Vars.orbitals,S0=Q+Vars.TSI),axis=0)*convfactor
         elif timeunit=='month':
             days=np.linspace((int(Vars.t)*365/12) % 365,(int(Vars.t)*365/12-1) % 365,30)
-            Q=lna(np.mean(earthsystem().insolation(Vars.Lat,days,Vars.orbitals,S0=Q+Vars.TSI),axis=0))*convfactor
+            Q=np.mean(earthsystem().insolation(Vars.Lat,days,Vars.orbitals,S0=Q+Vars.TSI),axis=0)*convfactor
         elif timeunit=='day':
             days=int(Vars.t)%365
-            Q=lna(earthsystem().insolation(Vars.Lat,days,Vars.orbitals,S0=Q+Vars.TSI))*convfactor
+            Q=earthsystem().insolation(Vars.Lat,days,Vars.orbitals,S0=Q+Vars.TSI)*convfactor
         elif timeunit=='second':
             tconv=60*60*24
             days=int(Vars.t/tconv)%365
-            Q=lna(earthsystem().insolation(Vars.Lat,days,Vars.orbitals,S0=Q+Vars.TSI))*convfactor
+            Q=earthsystem().insolation(Vars.Lat,days,Vars.orbitals,S0=Q+Vars.TSI)*convfactor
         else:
             sys.exit('insolation timeunit unknown')
         
@@ -2610,13 +2468,13 @@ class earthsystem:
         if builtins.Runtime_Tracker == 0:
             #Vars.orbtable=OrbitalTable()
             Vars.orbitals=Vars.orbtable.lookup_parameters(year/1000)
-            Q=lna(np.mean(insolation(Vars.Lat,days,Vars.orbitals,S0=Q+Vars.TSI),axis=1))
+            Q=np.mean(insolation(Vars.Lat,days,Vars.orbitals,S0=Q+Vars.TSI),axis=1)
         #updating for each kiloyear
         if unit=='year':            
             if year % 1000==0:
                 print('timeprogress: '+str(year/1000)+'ka')
                 Vars.orbitals=Vars.orbtable.lookup_parameters(year/1000)
-                Q=lna(np.mean(insolation(Vars.Lat,days,Vars.orbitals,S0=Q+Vars.TSI),axis=1))
+                Q=np.mean(insolation(Vars.Lat,days,Vars.orbitals,S0=Q+Vars.TSI),axis=1)
             else:
                 Q=Vars.solar
         else:
@@ -2659,48 +2517,27 @@ class earthsystem:
 
         """
         #Calculating the global wind patterns, with the function from sellers (1969)
-        #Meriwind_Selparam=[a]"""
-        
-        if builtins.parallelization==True:
-            #v=xr.DataArray(np.array([[0]*len(Vars.Lat2)]*builtins.number_of_parallels,dtype=float),coords=[np.arange(builtins.number_of_parallels),Vars.Lat2],dims=['parallel','lat2'])
-            v=np.reshape(np.zeros(builtins.number_of_parallels*len(Vars.Lat2)),(builtins.number_of_parallels,len(Vars.Lat2)))
-
-            T_av=np.average(np.abs(Vars.tempdif),weights=(2*np.pi*re*cosd(Vars.Lat2)),axis=1)
+        #Meriwind_Selparam=[a]
 
-        else: 
-            v=np.array([0]*len(Vars.Lat2),dtype=float)
-
-            T_av=np.average(np.abs(Vars.tempdif),weights=(2*np.pi*re*cosd(Vars.Lat2)))
         #Globaly averaged temperature difference
+        T_av=np.dot(np.abs(Vars.tempdif),lat_weights('Lat2'))
         
-        #filling the array with values depending on the current latitude
-        i=0        
-        while Vars.Lat[i]<5:
-            i+=1
-        k=i
+        #the sign of T_av depending on the current latitude, negative south of 5°N and positive north of it.
+        #It only depends on the grid and is set up once for it
+        if Vars.wind_sign[0] is not Vars.Lat:
+            sign=np.ones(len(Vars.Lat2))
+            sign[:np.count_nonzero(Vars.Lat<5)]=-1
+            Vars.wind_sign=[Vars.Lat,sign]
+        sign=Vars.wind_sign[1]
 
         if builtins.parallelization==True:
             if np.shape(a)==(len(Vars.Lat2),builtins.number_of_parallels):
                 a=np.transpose(a)
-            for l in range(builtins.number_of_parallels):
-                if np.shape(a)==(builtins.number_of_parallels,len(Vars.Lat2)):
-
-                    for j in range(k):
-                        v[l,j]=-a[l,j]*(Vars.tempdif[l,j]-T_av[l])
-                    for j in range(k,len(v[l])):
-                        v[l,j]=-a[l,j]*(Vars.tempdif[l,j]+T_av[l])
-                else:
-                    for j in range(k):
-                        v[l,j]=-a[j]*(Vars.tempdif[l,j]-T_av[l])
-                    for j in range(k,len(v[l])):
-                        v[l,j]=-a[j]*(Vars.tempdif[l,j]+T_av[l])   
-        else:
-            for j in range(k):
-                
-                v[j]=-a[j]*(Vars.tempdif[j]-T_av)
-                    
-            for j in range(k,len(v)):
-                v[j]=-a[j]*(Vars.tempdif[j]+T_av)
+            #one row per ensemble member
+            T_av=np.reshape(T_av,(-1,1))
+        v=np.multiply(sign,T_av,out=work_array('v',np.shape(Vars.tempdif)))
+        v+=Vars.tempdif
+        v*=-a
         return v
 
     def specific_saturation_humidity_sel(self,e0,eps,L,Rd,p):
@@ -2794,12 +2631,13 @@ class earthsystem:
         :rtype:                     array(float) (1D) 
 
         """
-        #temperature dependant equation of saturation pressure
-        if builtins.parallelization==True:
-
-            e=e0*(1-0.5*eps*L*Vars.tempdif/(Rd*np.array(Vars.T[:,1:])**2))
-        else:
-            e=e0*(1-0.5*eps*L*Vars.tempdif/(Rd*Vars.T[1:]**2))
+        #temperature dependant equation of saturation pressure (the slice along the last axis serves
+        #single and parallelized runs without copying the ZMT, the constants are grouped to one factor)
+        T=Vars.T[...,1:]
+        e=Vars.tempdif/(T*T)
+        e*=-0.5*eps*L/Rd
+        e+=1
+        e*=e0
         return e
 
     def humidity_difference(self,e0,eps,L,Rd,p):
@@ -2851,11 +2689,26 @@ class earthsystem:
         #equation of difference in humidity
         
         e=earthsystem().saturation_pressure(e0,eps,L,Rd)
-        if builtins.parallelization==True:
-            dq=eps**2*L*e*Vars.tempdif/(p*Rd*np.array(Vars.T[:,1:])**2)
-        else:
-            dq=eps**2*L*e*Vars.tempdif/(p*Rd*Vars.T[1:]**2)
+        T=Vars.T[...,1:]
+        dq=Vars.tempdif/(T*T)
+        dq*=e
+        dq*=eps**2*L/(p*Rd)
         return dq
+
+    @staticmethod
+    def _humidity(e0,eps,L,Rd,p):
+        #specific saturation humidity q and humidity difference dq (see specific_saturation_humidity_sel
+        #and humidity_difference) from one evaluation of the saturation pressure. With c=eps*L*dT/(Rd*T**2)
+        #it is e=e0*(1-0.5*c), q=eps*e/p and dq=c*q, evaluated into preallocated arrays
+        shape=np.shape(Vars.tempdif)
+        T=Vars.T[...,1:]
+        c=np.multiply(T,T,out=work_array('hum_c',shape))
+        np.divide(Vars.tempdif,c,out=c)
+        c*=eps*L/Rd
+        q=np.multiply(c,-0.5,out=work_array('hum_q',shape))
+        q+=1
+        q*=eps*e0/p
+        return q,np.multiply(c,q,out=c)
         
     def temperature_difference_latitudes(self):
         """ 
@@ -2887,12 +2740,17 @@ class earthsystem:
         #Calculation if for sellers it is desired to be defined on the latitudinal circles, 
         #with interpolation towards the poles
         if builtins.latitudinal_circle==True:
-            f=interpolator(Vars.Lat,Vars.T)
-            if builtins.both_hemispheres==True:
-                Lat_new=np.linspace(-90,90,int(180/builtins.spatial_resolution+1))
-            else:
-                Lat_new=np.linspace(0,90,int(90/builtins.spatial_resolution+1))
-            dT=f(Lat_new)[1:]-f(Lat_new)[:-1]
+            #The 4th order polyfit of the ZMT evaluated on the circles is linear in the ZMT. The map from the ZMT to the
+            #differences of the fit between the circles is set up once for the grid and applied with one matrix product
+            if Vars.tempdif_fit[0] is not Vars.Lat:
+                if builtins.both_hemispheres==True:
+                    Lat_new=np.linspace(-90,90,int(180/builtins.spatial_resolution+1))
+                else:
+                    Lat_new=np.linspace(0,90,int(90/builtins.spatial_resolution+1))
+                coefficients=np.polyfit(Vars.Lat,np.eye(len(Vars.Lat)),4)
+                fit=np.dot(np.vander(Lat_new,5),coefficients)
+                Vars.tempdif_fit=[Vars.Lat,np.transpose(fit[1:]-fit[:-1])]
+            dT=np.dot(Vars.T,Vars.tempdif_fit[1])
         return dT
 
     def length_latitudes(self,re):
@@ -2952,14 +2810,40 @@ class earthsystem:
         #Returning the area of a latitudinal belt
         
         #using latitudinal boundaries from circle defined latitudes 
-        lat_southbound=Vars.Lat2
-        lat_southbound=np.insert(lat_southbound,0,-90)
-        lat_northbound=Vars.Lat2
-        lat_northbound=np.append(lat_northbound,90)
-        #calculation from the areaportions of a sphere
-        A=np.pi*re**2*(sind((90-lat_southbound))**2+(1-cosd(90-lat_southbound))**2)-         np.pi*re**2*(np.sin((90-lat_northbound)*np.pi/180)**2+(1-np.cos((90-lat_northbound)*np.pi/180))**2)
+        bounds=np.concatenate(([-90],Vars.Lat2,[90]))
+        #calculation from the areaportions of a sphere, the area of the cap north of latitude phi is
+        #2*pi*re**2*(1-sin(phi)), so a belt between two boundaries has 2*pi*re**2*(sin(phi_n)-sin(phi_s))
+        A=2*np.pi*re**2*np.diff(sind(bounds))
         
         return A
+
+    def init_grid(self,re):
+        """ 
+        Sets the static grid variables used by ``transfer.sellers``: the length of the latitudinal circles ``Vars.latlength``, the area of the latitudinal belts ``Vars.area`` and their ratios ``Vars.transfer_weights``.
+
+        It is called by ``transfer.sellers`` with its earth's radius and only recomputes the variables if the grid or the radius changed (e.g. a radius given per ensemble member or set by ``Optimization.add_parameters``).
+       
+        **Function-call arguments** \n
+        
+        :param float re:        The earth's radius
+                            
+                                * type: float / array(floats) (per ensemble member, shape (number_of_parallels,1))
+                                * unit: meter
+                                * value: :math:`6.371\cdot 10^6`
+
+        :returns:               No return
+
+        """
+        if Vars.grid_radius[0] is Vars.Lat and np.array_equal(Vars.grid_radius[1],re):
+            return
+        latlength=self.length_latitudes(re)
+        area=self.area_latitudes(re)
+        #latlength divided by the area of the belt north/south of each latitudinal circle,
+        #formed in float64 and stored in the precision of the model state
+        Vars.transfer_weights=np.array([latlength/area[...,1:],latlength/area[...,:-1]],dtype=Vars.dtype)
+        Vars.latlength=np.asarray(latlength,dtype=Vars.dtype)
+        Vars.area=np.asarray(area,dtype=Vars.dtype)
+        Vars.grid_radius=[Vars.Lat,np.copy(re)]
         
 #class tools:
     """
@@ -2980,6 +2864,79 @@ def sind(Lat):
     #Returning the value of sine with input in degree
     return np.sin(Lat*np.pi/180)
 
+def parallel_columns(*paras):
+    #Returning the parameters of a parallelized run with those given per ensemble member (shape (number_of_parallels,))
+    #reshaped to columns, which broadcast along the latitudes of the (number_of_parallels,len(Lat)) ZMT
+    member_shape=(builtins.number_of_parallels,)
+    return [np.reshape(x,(-1,1)) if np.shape(x)==member_shape else x for x in paras]
+
+def lat_weights(key):
+    #Returning the cosine weights of the grid Vars.Lat (key 'Lat') or Vars.Lat2 (key 'Lat2') normalized to a sum of 1,
+    #so that np.dot gives the area weighted average. They are computed once for each grid
+    Lat=getattr(Vars,key)
+    weights=Vars.lat_weights.get(key)
+    if weights is None or weights[0] is not Lat:
+        w=cosd(Lat)
+        weights=Vars.lat_weights[key]=(Lat,w/np.sum(w))
+    return weights[1]
+
+def forcing_index(times,index):
+    #Returning the index of the first entry of the forcing times (ascending) which is not earlier than Vars.t,
+    #searched from the current tracker index on, or len(times) if Vars.t is past the last entry.
+    #This replaces stepping the tracker forward one entry at a time with one binary search
+    if Vars.t<=times[index]:
+        return index
+    return index+np.searchsorted(times[index:],Vars.t)
+
+def advance_forcing(tracker,times,values,end_value,output,k=1,m=0):
+    #Advancing the tracker [index,value] of a forcing with the data (times,values) to the current time Vars.t:
+    #the value becomes the entry preceding the first time not earlier than Vars.t, or end_value once Vars.t is past
+    #the last entry. Returning value*k+m, which is also written to the readout storage output at readout steps
+    i=forcing_index(times,tracker[0])
+    if i==len(times):
+        tracker[0]=len(times)-1
+        tracker[1]=end_value
+    elif i>tracker[0]:
+        tracker[1]=values[i-1]
+        tracker[0]=i
+    F=tracker[1]*k+m
+    if builtins.Runtime_Tracker % builtins.readout_period == 0:
+        output[builtins.Runtime_Tracker//builtins.readout_period]=F
+    return F
+
+def read_data(filename,**kwargs):
+    #Returning np.genfromtxt(filename,**kwargs) of a forcing data file. The parsed data is kept in Vars.data_cache
+    #until the file is modified, so repeated runs do not parse the same text file again. A copy is returned
+    #because the forcing functions convert the data in place
+    key=(filename,os.path.getmtime(filename),repr(sorted(kwargs.items())))
+    if key not in Vars.data_cache:
+        Vars.data_cache[key]=np.genfromtxt(filename,encoding='ISO-8859-1',**kwargs)
+    return Vars.data_cache[key].copy()
+
+def readout(key,value):
+    #Writing value to the storage variable Vars.Read[key] at the current readout index.
+    #On the first array valued readout the storage is extended to shape (readouts,*value.shape), with the rows
+    #already written broadcast into it. The storage variable Vars.<key> is rebound to the extended array if it
+    #still refers to the storage (Vars.solar and Vars.alpha are also set by flux_down.insolation)
+    storage=Vars.Read[key]
+    if np.ndim(value)>=np.ndim(storage):
+        extended=np.zeros((len(storage),)+np.shape(value))
+        extended[...]=np.reshape(storage,np.shape(storage)+(1,)*(np.ndim(value)-np.ndim(storage)+1))
+        if getattr(Vars,key,None) is storage:
+            setattr(Vars,key,extended)
+        storage=Vars.Read[key]=extended
+    storage[builtins.Runtime_Tracker//builtins.readout_period]=value
+
+def work_array(key,shape=None):
+    #Returning the preallocated array Vars.Buffer[key] with the shape of Vars.T (or shape) to evaluate
+    #expressions with out=. It is (re)allocated on first use or if the grid changed; callers overwrite its content
+    if shape is None:
+        shape=np.shape(Vars.T)
+    buf=Vars.Buffer.get(key)
+    if buf is None or buf.shape!=shape or buf.dtype!=Vars.dtype:
+        buf=Vars.Buffer[key]=np.empty(shape,dtype=Vars.dtype)
+    return buf
+
 def plotmeanstd(array):
     #calculation of an arrays mean value and standard deviation, with regard to the equilibrium condition chosen
     #Used to process the final output data
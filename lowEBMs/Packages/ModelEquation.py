@@ -8,6 +8,8 @@ In ``lowEBMs.Packages.ModelEquation`` modules are defined which build the EBM fr
 
 with the deviation function :math:`y=\\frac{dT}{dt}` required by the ``lowEBMs.Packages.RK4.rk4alg`` and :math:`C_{ao}` the heat capacity of the system which is passed to the right side of the model equation.
 
+``model_equation`` evaluates this sum for any configuration. ``compile_model_equation`` builds the same sum specialized to one configuration, which is what ``lowEBMs.Packages.RK4.rk4alg`` integrates.
+
 
 """
 import numpy as np
@@ -48,7 +50,7 @@ def model_equation(eqparam,funccomp):
     funcparam=funccomp['funcparam']
     C_ao=eqparam['c_ao']                    #Extracting Equationparameters
     if builtins.parallelization==True:
-        C_ao=np.transpose(np.array([C_ao]*len(Vars.Lat))) if np.shape(C_ao)==(builtins.number_of_parallels,) else C_ao
+        C_ao=np.reshape(C_ao,(-1,1)) if np.shape(C_ao)==(builtins.number_of_parallels,) else C_ao
     for funcnum in funclist:
         if builtins.control==True:
             if qualname(funclist[funcnum])[:7]=='forcing':
@@ -59,3 +61,37 @@ def model_equation(eqparam,funccomp):
             y += funclist[funcnum](funcparam[funcnum])    #Calling the selected function and sum them up 
     return y/C_ao           #output of y, weighted with the heat capacity
 
+def compile_model_equation(eqparam,funccomp):
+    """
+    Builds a version of ``model_equation`` specialized to one configuration.
+
+    The functions and their parameter dictionaries of **funccomp** are fixed when this is called. The sum over the functions is generated as source code with one line per function, so that every evaluation calls the functions directly instead of iterating over the dictionaries. The parameter dictionaries are passed by reference, changes of their values remain effective. As in ``model_equation``, the heat capacity is read from **eqparam** and the control mode (forcings are skipped) from ``builtins.control`` at every evaluation.
+
+    **Function-call arguments** \n
+
+    :param dict eqparam:        Configuration dictionary containing additional information for the model equation (see ``model_equation``)
+
+    :param dict funccomp:       Configuration 2D dictionary containing function names and function parameters used (see ``model_equation``)
+
+    :returns:                   A function with the call signature of ``model_equation`` which returns the temperature gradient :math:`\\frac{dT}{dt}` (Kelvin/seconds) of this configuration
+
+    :rtype:                     function
+
+    """
+    funclist=funccomp['funclist']
+    funcparam=funccomp['funcparam']
+    namespace={'np': np,'builtins': builtins}
+    source=['def model_equation(eqparam,funccomp):','    y=0']
+    for i,funcnum in enumerate(funclist):
+        namespace['f%i'%i],namespace['p%i'%i]=funclist[funcnum],funcparam[funcnum]
+        if qualname(funclist[funcnum])[:7]=='forcing':
+            source.append('    if builtins.control!=True: y += f%i(p%i)    #%s'%(i,i,funcnum))
+        else:
+            source.append('    y += f%i(p%i)    #%s'%(i,i,funcnum))
+    source+=['    C_ao=eqparam[\'c_ao\']',
+             '    if builtins.parallelization==True and np.shape(C_ao)==(builtins.number_of_parallels,):',
+             '        C_ao=np.reshape(C_ao,(-1,1))',
+             '    return y/C_ao']
+    exec(compile('\n'.join(source),'<model_equation>','exec'),namespace)
+    return namespace['model_equation']
+
@@ -41,7 +41,7 @@ to estimate :math:`y_1` as final step of one iteration step:
 
 """
 
-from lowEBMs.Packages.ModelEquation import model_equation
+from lowEBMs.Packages.ModelEquation import model_equation, compile_model_equation
 from lowEBMs.Packages.Functions import *
 from lowEBMs.Packages.Variables import Vars
 import numpy as np
@@ -62,7 +62,7 @@ def rk4alg(func,eqparam,rk4input,funccomp,progressbar=True,monthly=False):
 
     **Function-call arguments** \n
     
-    :param function func:       The name of the model equation which will be solved (for now always model_equation)
+    :param function func:       The name of the model equation which will be solved (for now always model_equation, which is integrated in the version specialized to **funccomp** by ``compile_model_equation``)
 
     :param dict eqparam:        Configuration dictionary containing information needed for **func**:
                                 
@@ -166,6 +166,8 @@ def rk4alg(func,eqparam,rk4input,funccomp,progressbar=True,monthly=False):
     #print('Starting simulation...')
     #locally defining rk4input parameters
     n,h=int(builtins.number_of_integration),builtins.stepsize_of_integration
+    if func is model_equation:
+        func=compile_model_equation(eqparam,funccomp)
     #Creating an array of the variables t,T,Lat,T_global which will be the outputarray
     if builtins.spatial_resolution>0:
         if builtins.parallelization:
@@ -182,6 +184,11 @@ def rk4alg(func,eqparam,rk4input,funccomp,progressbar=True,monthly=False):
     data[0][0]=Vars.t #time t
     data[1][0]=Vars.T #Temperature T
     data[2][0]=Vars.T_global #Global mean temperature T_global
+    #Ensuring a C-contiguous ZMT of the chosen precision (it may have been set from a slice of previous output)
+    if builtins.spatial_resolution>0:
+        Vars.T=np.ascontiguousarray(Vars.T,dtype=Vars.dtype)
+        if __debug__:
+            assert Vars.T.flags['C_CONTIGUOUS'] and Vars.T.dtype==Vars.dtype
     ###Running runge Kutta 4th order n times###
     j=0
     if progressbar:
@@ -208,6 +215,9 @@ def rk4alg(func,eqparam,rk4input,funccomp,progressbar=True,monthly=False):
         #For the time simply adding the integration stepsize
         Vars.t = Vars.t + h
         Vars.T = T0 + (k1 + k2 + k2 + k3 + k3 + k4) / 6
+        if builtins.spatial_resolution>0 and Vars.dtype!=np.float64:
+            #float64 parameters may have upcast the increments
+            Vars.T = Vars.T.astype(Vars.dtype,copy=False)
         if builtins.spatial_resolution>0:
             Vars.T_global = earthsystem().globalmean_temperature()
         else: #if 0 dimensional
@@ -268,6 +278,7 @@ def rk4alg(func,eqparam,rk4input,funccomp,progressbar=True,monthly=False):
         builtins.eq_condition_length=rk4input['eq_condition_length']
         builtins.eq_condition_amplitude=rk4input['eq_condition_amplitude']
         builtins.data_readout=rk4input['data_readout']
+        builtins.readout_period=int(4*builtins.data_readout)
         builtins.number_of_integration=rk4input['number_of_integration']
         Vars.t=0
         builtins.Runtime_Tracker=0
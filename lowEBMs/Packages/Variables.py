@@ -91,6 +91,26 @@ class Vars():
     +---------------+-----------------------------------------------------------------------+   
     | tempdif       | The temperature difference between entries of the ZMT                 |
     +---------------+-----------------------------------------------------------------------+         
+    | R_in_cache    | A copy of the last R_in with its TSI and AOD (static albedo)          |
+    +---------------+-----------------------------------------------------------------------+
+    | lat_weights   | The normalized cosine weights of the grid (see ``lat_weights``)       |
+    +---------------+-----------------------------------------------------------------------+
+    | data_cache    | The parsed forcing data files (see ``read_data``)                     |
+    +---------------+-----------------------------------------------------------------------+
+    | solar_cache   | The last annual mean insolation with the grid, orbit and S0 it is for |
+    +---------------+-----------------------------------------------------------------------+
+    | tempdif_fit   | The grid with the linear map of the ZMT to the polyfit differences    |
+    +---------------+-----------------------------------------------------------------------+
+    | wind_sign     | The grid with the sign of the mean wind term, negative south of 5°N   |
+    +---------------+-----------------------------------------------------------------------+
+    | Lat_0D        | The grid of the global mean insolation of 0D runs                     |
+    +---------------+-----------------------------------------------------------------------+
+    | Lat_abs       | The grid with its absolute latitudes                                  |
+    +---------------+-----------------------------------------------------------------------+
+    | AOD_factor    | The last AOD with its attenuation factor exp(-AOD)                    |
+    +---------------+-----------------------------------------------------------------------+
+    | Buffer        | Preallocated work arrays of the flux functions (see ``work_array``)   |
+    +---------------+-----------------------------------------------------------------------+
     
     **Static variables:**
 
@@ -109,12 +129,18 @@ class Vars():
     +-----------------------+-----------------------------------------------------------------------+
     | latlength             | The circumference of a latitudinal circle                             |
     +-----------------------+-----------------------------------------------------------------------+   
+    | transfer_weights      | latlength divided by the area of the belt north/south of the circle   |
+    +-----------------------+-----------------------------------------------------------------------+
+    | grid_radius           | The grid and the earth's radius of latlength, area, transfer_weights  |
+    +-----------------------+-----------------------------------------------------------------------+
     | External_time_start   | The simulation time when the external forcing sets in                 |
     +-----------------------+-----------------------------------------------------------------------+   
     | CO2_time_start        | The simulation time when the CO2 forcing sets in                      |
     +-----------------------+-----------------------------------------------------------------------+   
     | start_time            | The real clock time when the simulation was started                   |
     +-----------------------+-----------------------------------------------------------------------+       
+    | dtype                 | The floating point precision of the state arrays (float64 or float32) |
+    +-----------------------+-----------------------------------------------------------------------+
  
     **Storage variables:**
 
@@ -165,8 +191,18 @@ class Vars():
     OrbitalTracker=[0,{'ecc': 0, 'long_peri': 0, 'obliquity': 0}]
     meridional=list
     tempdif=list
-    TSI=float
-    AOD=float
+    TSI=0
+    AOD=0
+    R_in_cache=[None,None,None]
+    lat_weights={}
+    data_cache={}
+    solar_cache=[None,None]
+    tempdif_fit=[None,None]
+    wind_sign=[None,None]
+    Lat_0D=np.linspace(-85,85,18)
+    Lat_abs=[None,None]
+    AOD_factor=[0,1]
+    Buffer={}
     
     ###Static variables###
     Lat=float
@@ -175,12 +211,15 @@ class Vars():
     area=list
     bounds=list
     latlength=list
+    transfer_weights=list
+    grid_radius=[None,None]
     External_time_start=float
     CO2_time_start=float
     ExternalOrbitals_time_start=float
     Solar_time_start=float
     AOD_time_start=float
     start_time=float
+    dtype=np.float64
 
     ###Storage variables###
     cL=list
@@ -222,19 +261,32 @@ class Vars():
         self.OrbitalTracker=[0,{'ecc': 0, 'long_peri': 0, 'obliquity': 0}]
         self.meridional=list
         self.tempdif=list
-        self.TSI=float
-        self.AOD=float
+        self.TSI=0
+        self.AOD=0
+        self.R_in_cache=[None,None,None]
+        self.lat_weights={}
+        self.data_cache={}
+        self.solar_cache=[None,None]
+        self.tempdif_fit=[None,None]
+        self.wind_sign=[None,None]
+        self.Lat_0D=np.linspace(-85,85,18)
+        self.Lat_abs=[None,None]
+        self.AOD_factor=[0,1]
+        self.Buffer={}
         
         self.solar=list
         self.area=list
         self.bounds=list
         self.latlength=list
+        self.transfer_weights=list
+        self.grid_radius=[None,None]
         self.External_time_start=float
         self.CO2_time_start=float
         self.ExternalOrbitals_time_start=float
         self.Solar_time_start=float
         self.AOD_time_start=float
         self.start_time=float
+        self.dtype=np.float64
     
         self.cL=list
         self.C=list
@@ -304,13 +356,13 @@ def datareset():
     Vars.Lat=classreset.Lat
     Vars.Lat2=classreset.Lat2
 
-def variable_importer(config,initialZMT=True,control=False,parallel=False,parallel_config=0,accuracy=1e-3,accuracy_number=1000):
+def variable_importer(config,initialZMT=True,control=False,parallel=False,parallel_config=0,accuracy=1e-3,accuracy_number=1000,dtype=np.float64):
     """ 
     Executes all relevant functions to import variables for a single simulation run. From the *configuration* dictionary, returned by ``Configuration.importer``, the relevant information is extracted and the specific importer functions are executed in the following order:
 
     .. math::
         
-        buliltin \_ importer \quad \\rightarrow \quad initial \_ importer \quad \\rightarrow \quad output \_ importer
+        buliltin \_ importer \quad \\rightarrow \quad initial \_ importer \quad \\rightarrow \quad output \_ importer \quad \\rightarrow \quad grid \_ importer
 
     .. Note::
 
@@ -320,9 +372,12 @@ def variable_importer(config,initialZMT=True,control=False,parallel=False,parall
 
     :param dict config:         The configuration dictionary returned by ``Configuration.importer``  
 
+    :param type dtype:          The floating point precision of the state arrays. ``np.float32`` halves the memory traffic of large ensemble runs, ``np.float64`` (default) is kept for verification runs
+
     :returns:                   No return
 
     """
+    Vars.dtype=dtype
     builtin_importer(config['rk4input'],control=control,parallel=parallel,parallel_config=parallel_config,accuracy=accuracy,accuracy_number=accuracy_number)
     trackerreset()
     initial_importer(config['initials'],initialZMT=initialZMT,control=control,parallel=parallel)
@@ -369,6 +424,8 @@ def builtin_importer(rk4input,control=False,parallel=False,parallel_config=0,acc
     +---------------------------+-----------------------------------------------------------------------+    
     | Noise_Tracker             | Tracks the value of solar noise                                       |
     +---------------------------+-----------------------------------------------------------------------+    
+    | readout_period            | The number of model equation evaluations between readouts (4*data_readout) |
+    +---------------------------+-----------------------------------------------------------------------+    
     | parallelization           | Indicates if parallelized simulations are enabled                     |
     +---------------------------+-----------------------------------------------------------------------+
 
@@ -409,7 +466,8 @@ def builtin_importer(rk4input,control=False,parallel=False,parallel_config=0,acc
         builtins.eq_condition_amplitude=accuracy
         print('Starting controlrun with a temperature accuracy of %s K on the GMT over %s datapoints.' %(accuracy,accuracy_number))
     else:
-        builtins.control=False 
+        builtins.control=False
+    builtins.readout_period=int(4*builtins.data_readout) 
 
 def initial_importer(initials,initialZMT=True,control=False,parallel=False):
     """
@@ -490,6 +548,9 @@ def initial_importer(initials,initialZMT=True,control=False,parallel=False):
         Vars.T_global=np.array([initials['gmt']]*number_of_parallels)
     else:
         Vars.T_global=initials['gmt']
+    if dim==1 and initialZMT==True:
+        #C-contiguous layout, (number_of_parallels,len(Lat)) or (len(Lat),)
+        Vars.T=np.ascontiguousarray(Vars.T,dtype=Vars.dtype)
 
 def output_importer(functiondict):
     functionlist=list(functiondict.values())
@@ -499,57 +560,38 @@ def output_importer(functiondict):
     The lists are directly written to their entry in ``Variable.Vars`` and can be returned after the simulation is finished. 
 
     """
+    #Number of readouts, one per builtins.data_readout steps
     if (builtins.number_of_integration) % builtins.data_readout == 0:
-        #Assigning dynamical variables in Variables Package with initial values from var
-        for func in functionlist:
-            if qualname(func)=='transfer.sellers':
-                Vars.cL=np.array([0]*int(builtins.number_of_integration/builtins.data_readout),dtype=object)
-                Vars.C=np.array([0]*int(builtins.number_of_integration/builtins.data_readout),dtype=object)
-                Vars.F=np.array([0]*int(builtins.number_of_integration/builtins.data_readout),dtype=object)
-                Vars.P=np.array([0]*int(builtins.number_of_integration/builtins.data_readout),dtype=object)
-                Vars.Transfer=np.array([0]*int(builtins.number_of_integration/builtins.data_readout),dtype=object)
-            if qualname(func)=='transfer.budyko':
-                Vars.BudTransfer=np.array([0]*int(builtins.number_of_integration/builtins.data_readout),dtype=object)
-            if qualname(func)=='forcing.co2_myhre':
-                Vars.CO2Output=np.array([0]*int(builtins.number_of_integration/builtins.data_readout),dtype=object)
-            if qualname(func)=='forcing.solar':                
-                Vars.SolarOutput=np.array([0]*int(builtins.number_of_integration/builtins.data_readout),dtype=object)
-            if qualname(func)=='forcing.aod':            
-                Vars.AODOutput==np.array([0]*int(builtins.number_of_integration/builtins.data_readout),dtype=object)
-                
-        Vars.ExternalOutput=np.array([0]*int(builtins.number_of_integration/builtins.data_readout),dtype=object)
-        Vars.alpha=np.array([0]*int(builtins.number_of_integration/builtins.data_readout),dtype=object)
-        Vars.solar=np.array([0]*int(builtins.number_of_integration/builtins.data_readout),dtype=object)
-        Vars.noise=np.array([0]*int(builtins.number_of_integration/builtins.data_readout),dtype=object)
-        Vars.Rdown=np.array([0]*int(builtins.number_of_integration/builtins.data_readout),dtype=object)
-        #Vars.Rup=np.reshape(np.zeros(int(builtins.number_of_integration/builtins.data_readout)*len(Vars.Lat)),(int(builtins.number_of_integration/builtins.data_readout),len(Vars.Lat)))
-        Vars.Rup=np.array([0]*int(builtins.number_of_integration/builtins.data_readout),dtype=object)
-    else: 
-        for func in functionlist:
-            if qualname(func)=='transfer.sellers':
-                Vars.cL=np.array([0]*int(builtins.number_of_integration/builtins.data_readout+1),dtype=object)
-                Vars.C=np.array([0]*int(builtins.number_of_integration/builtins.data_readout+1),dtype=object)
-                Vars.F=np.array([0]*int(builtins.number_of_integration/builtins.data_readout+1),dtype=object)
-                Vars.P=np.array([0]*int(builtins.number_of_integration/builtins.data_readout+1),dtype=object)
-                Vars.Transfer=np.array([0]*int(builtins.number_of_integration/builtins.data_readout+1),dtype=object)
-            if qualname(func)=='transfer.budyko':
-                Vars.BudTransfer=np.array([0]*int(builtins.number_of_integration/builtins.data_readout+1),dtype=object)
-            if qualname(func)=='forcing.co2_myhre':
-                Vars.CO2Output=np.array([0]*int(builtins.number_of_integration/builtins.data_readout+1),dtype=object)
-            if qualname(func)=='forcing.solar':                
-                Vars.SolarOutput=np.array([0]*int(builtins.number_of_integration/builtins.data_readout+1),dtype=object)
-            if qualname(func)=='forcing.aod':            
-                Vars.AODOutput==np.array([0]*int(builtins.number_of_integration/builtins.data_readout+1),dtype=object)
-                
-        Vars.ExternalOutput=np.array([0]*int(builtins.number_of_integration/builtins.data_readout+1),dtype=object)
-        Vars.alpha=np.array([0]*int(builtins.number_of_integration/builtins.data_readout+1),dtype=object)
-        Vars.solar=np.array([0]*int(builtins.number_of_integration/builtins.data_readout+1),dtype=object)
-        Vars.noise=np.array([0]*int(builtins.number_of_integration/builtins.data_readout+1),dtype=object)
-        Vars.Rdown=np.array([0]*int(builtins.number_of_integration/builtins.data_readout+1),dtype=object)
-        #Vars.Rup=np.reshape(np.zeros(int(builtins.number_of_integration/builtins.data_readout)*len(Vars.Lat)),(int(builtins.number_of_integration/builtins.data_readout),len(Vars.Lat)))
-        Vars.Rup=np.array([0]*int(builtins.number_of_integration/builtins.data_readout+1),dtype=object)
-        
+        n=int(builtins.number_of_integration/builtins.data_readout)
+    else:
+        n=int(builtins.number_of_integration/builtins.data_readout+1)
+    #Assigning dynamical variables in Variables Package with initial values from var.
+    #Storage variables are dense float arrays; 1D fields are extended to (n,*shape) on their first readout
+    for func in functionlist:
+        if qualname(func)=='transfer.sellers':
+            Vars.cL=np.zeros(n)
+            Vars.C=np.zeros(n)
+            Vars.F=np.zeros(n)
+            Vars.P=np.zeros(n)
+            Vars.Transfer=np.zeros(n)
+        if qualname(func)=='transfer.budyko':
+            Vars.BudTransfer=np.zeros(n)
+        if qualname(func)=='forcing.co2_myhre':
+            Vars.CO2Output=np.zeros(n)
+        if qualname(func)=='forcing.solar':                
+            Vars.SolarOutput=np.zeros(n)
+        if qualname(func)=='forcing.aod':            
+            Vars.AODOutput=np.zeros(n)
+            
+    Vars.ExternalOutput=np.zeros(n)
+    Vars.alpha=np.zeros(n)
+    Vars.solar=np.zeros(n)
+    Vars.noise=np.zeros(n)
+    Vars.Rdown=np.zeros(n)
+    Vars.Rup=np.zeros(n)
+    
     
+    #object rows, because a forcing may be a float (0D, predefined) or an array over the latitudes (predefined1d)
     Vars.ExternalOutput=np.array([Vars.ExternalOutput for i in range(int(builtins.number_of_externals))],dtype=object)
     Vars.External_time_start=np.array([0 for i in range(int(builtins.number_of_externals))],dtype=object)
     Vars.ForcingTracker=np.array([[0,0] for i in range(int(builtins.number_of_externals))],dtype=object)
@@ -0,0 +1,90 @@
+import builtins
+import numpy as np
+
+from lowEBMs.Packages.Configuration import importer
+from lowEBMs.Packages.Variables import variable_importer, Vars
+from lowEBMs.Packages.RK4 import rk4alg
+from lowEBMs.Packages.ModelEquation import model_equation
+from lowEBMs.Packages.Functions import forcing, forcing_index, advance_forcing
+import lowEBMs
+
+configpath=lowEBMs.__path__[0]+'/Tutorials/Config/'
+
+def test_predefined1d_readout(tmp_path):
+    #A latitudinal forcing imported with forcing.predefined1d is written to Vars.ExternalOutput at readouts
+    config=importer('EBM1D_Budyko_static_config.ini',path=configpath)
+    config['rk4input']['number_of_integration']=20
+    config['rk4input']['number_of_externals']=1
+    variable_importer(config,initialZMT=True)
+    n=len(Vars.Lat)
+
+    #one row per day, the forcing of each latitude is its index+1
+    data=np.column_stack([np.arange(10.)]+[np.full(10,1.+j) for j in range(n)])
+    np.savetxt(tmp_path/'forcing1d.txt',data,delimiter=',')
+    key='func'+str(len(config['funccomp']['funclist']))
+    config['funccomp']['funclist'][key]=forcing().predefined1d
+    config['funccomp']['funcparam'][key]={'forcingnumber':0,'datapath':str(tmp_path)+'/','name':'forcing1d.txt','delimiter':',',
+        'header':0,'footer':0,'col_time':0,'colrange_forcing':[1,n+1],'timeunit':'day','BP':False,'time_start':0,
+        'k_output':1,'m_output':0,'k_input':1,'m_input':0}
+    variable_importer(config,initialZMT=True)
+
+    rk4alg(model_equation,config['eqparam'],config['rk4input'],config['funccomp'],progressbar=False)
+
+    #readouts every 4 days: the forcing at day 4 and 8, then 0 after the last entry (day 9)
+    output=Vars.ExternalOutput[0]
+    assert np.shape(output[1])==(n,)
+    np.testing.assert_allclose(output[1],np.arange(1.,n+1))
+    np.testing.assert_allclose(output[2],np.arange(1.,n+1))
+    np.testing.assert_allclose(output[3],np.zeros(n))
+    #after the end of the record the tracker stays on the last entry with the zero forcing
+    assert Vars.ForcingTracker[0][0]==9
+    np.testing.assert_array_equal(Vars.ForcingTracker[0][1],np.zeros(n))
+
+def test_aod_readout(tmp_path):
+    #the AOD imported with forcing.aod is written to Vars.AODOutput at readouts
+    config=importer('EBM1D_Budyko_static_config.ini',path=configpath)
+    config['rk4input']['number_of_integration']=20
+    np.savetxt(tmp_path/'aod.txt',np.column_stack([np.arange(10.),0.1*np.arange(1.,11.)]),delimiter=',')
+    key='func'+str(len(config['funccomp']['funclist']))
+    config['funccomp']['funclist'][key]=forcing().aod
+    config['funccomp']['funcparam'][key]={'datapath':str(tmp_path)+'/','name':'aod.txt','delimiter':',','header':0,'footer':0,
+        'col_time':0,'col_forcing':1,'timeunit':'day','BP':False,'time_start':0,'k_output':1,'m_output':0,'k_input':1,'m_input':0}
+    variable_importer(config,initialZMT=True)
+
+    rk4alg(model_equation,config['eqparam'],config['rk4input'],config['funccomp'],progressbar=False)
+
+    #readouts every 4 days: the AOD of the entry before day 4 and 8, then 0 after the last entry (day 9)
+    assert Vars.Read['AODOutput'] is Vars.AODOutput
+    np.testing.assert_allclose(Vars.AODOutput[:4],[0,0.4,0.8,0])
+    assert Vars.AODTracker[0]==9 and Vars.AODTracker[1]==0
+
+def test_forcing_index():
+    #the first entry not earlier than Vars.t, searched from the tracker index on, or len(times) after the record
+    times=np.array([0.,1.,2.,3.])
+    t=Vars.t
+    try:
+        for time,index,expected in [(0.,0,0),(0.5,0,1),(1.,0,1),(2.5,1,3),(2.5,3,3),(3.,0,3),(3.5,2,4)]:
+            Vars.t=time
+            assert forcing_index(times,index)==expected
+    finally:
+        Vars.t=t
+
+def test_advance_forcing_tracker():
+    #the tracker keeps the value of the last crossed entry, also when several entries are crossed in one step,
+    #and ends on the last entry with the end value after the record
+    times=np.array([0.,1.,2.,3.,4.])
+    values=np.array([10.,20.,30.,40.,50.])
+    tracker=[0,0]
+    output=np.zeros(8)
+    t,runtime,period=Vars.t,builtins.Runtime_Tracker,builtins.readout_period
+    try:
+        builtins.readout_period=4
+        expected=[(0.,0,0),(0.5,1,10.),(0.8,1,10.),(3.5,4,40.),(4.,4,40.),(6.,4,-1.)]
+        for step,(time,index,value) in enumerate(expected):
+            Vars.t=time
+            builtins.Runtime_Tracker=4*step
+            assert advance_forcing(tracker,times,values,-1.,output,k=2,m=1)==value*2+1
+            assert tracker==[index,value]
+        np.testing.assert_array_equal(output[:6],[1.,21.,21.,81.,81.,-1.])
+    finally:
+        Vars.t,builtins.Runtime_Tracker,builtins.readout_period=t,runtime,period
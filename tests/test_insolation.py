@@ -0,0 +1,30 @@
+import builtins
+import numpy as np
+
+from lowEBMs.Packages.Configuration import importer
+from lowEBMs.Packages.Variables import variable_importer, Vars
+from lowEBMs.Packages.RK4 import rk4alg
+from lowEBMs.Packages.ModelEquation import model_equation
+import lowEBMs
+
+configpath=lowEBMs.__path__[0]+'/Tutorials/Config/'
+
+def test_static_albedo_cache_is_private():
+    #with a static albedo the RK4 substeps reuse R_in, changes to the returned array must not alter it
+    config=importer('EBM1D_Budyko_static_config.ini',path=configpath)
+    config['rk4input']['number_of_integration']=1
+    variable_importer(config,initialZMT=True)
+    rk4alg(model_equation,config['eqparam'],config['rk4input'],config['funccomp'],progressbar=False)
+    insolation=config['funccomp']['funclist']['func0']
+    funcparam=config['funccomp']['funcparam']['func0']
+
+    tracker=builtins.Runtime_Tracker
+    try:
+        builtins.Runtime_Tracker=4
+        R_in=np.array(insolation(funcparam))
+        builtins.Runtime_Tracker=5
+        insolation(funcparam)[...]=0
+        builtins.Runtime_Tracker=6
+        np.testing.assert_array_equal(insolation(funcparam),R_in)
+    finally:
+        builtins.Runtime_Tracker=tracker
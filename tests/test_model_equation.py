@@ -0,0 +1,65 @@
+import builtins
+import numpy as np
+
+from lowEBMs.Packages.Configuration import importer, add_sellersparameters, parameterinterpolatorstepwise
+from lowEBMs.Packages.Variables import variable_importer, Vars
+from lowEBMs.Packages.RK4 import rk4alg
+from lowEBMs.Packages.ModelEquation import model_equation, compile_model_equation
+from lowEBMs.Packages.Optimization import add_parameters
+import lowEBMs
+
+configpath=lowEBMs.__path__[0]+'/Tutorials/Config/'
+
+def uncompiled(eqparam,funccomp):
+    #model_equation behind a different function, which rk4alg integrates without compiling it
+    return model_equation(eqparam,funccomp)
+
+def run(func,filename,parallel=False,control=False,sellers=False,number_of_integration=20):
+    config=importer(filename,path=configpath)
+    config['rk4input']['number_of_integration']=number_of_integration
+    if parallel:
+        setup={'number_of_parameters': 1, 'number_of_cycles': 1, 'number_of_parallels': 3}
+        variable_importer(config,initialZMT=True,parallel=True,parallel_config=setup)
+    else:
+        variable_importer(config,initialZMT=True,control=control)
+    if sellers:
+        config,paras=add_sellersparameters(config,parameterinterpolatorstepwise,'SellersParameterization.ini',2,0,True,True,path=configpath+'Data/')
+    if parallel:
+        config=add_parameters(config,[[0.6,0.65,0.7]],[['func1','m']])
+        config['eqparam']['c_ao']=np.array([0.8,1.,1.2])*config['eqparam']['c_ao']
+    return rk4alg(func,config['eqparam'],config['rk4input'],config['funccomp'],progressbar=False)
+
+def compare(**kwargs):
+    compiled,reference=run(model_equation,**kwargs),run(uncompiled,**kwargs)
+    for i in range(3):
+        np.testing.assert_array_equal(compiled[i],reference[i])
+
+def test_compiled_single():
+    compare(filename='EBM1D_Budyko_static_config.ini')
+
+def test_compiled_ensemble():
+    compare(filename='EBM1D_parallel_Ensemble_config.ini',parallel=True,sellers=True)
+
+def test_compiled_control():
+    compare(filename='EBM0D_volcanic_config.ini',control=True)
+
+def test_compiled_reads_eqparam_and_control():
+    #the heat capacity and the control mode are taken at every evaluation, not when compiling
+    def flux(funcparam):
+        return 2.
+    def forcing_constant(funcparam):
+        return 1.
+    forcing_constant.__qualname__='forcing.constant'
+    eqparam={'c_ao': 1.}
+    funccomp={'funclist': {'func0': flux,'func1': forcing_constant},'funcparam': {'func0': {},'func1': {}}}
+    control,parallelization=builtins.control,builtins.parallelization
+    try:
+        builtins.control,builtins.parallelization=False,False
+        compiled=compile_model_equation(eqparam,funccomp)
+        assert compiled(eqparam,funccomp)==3.
+        eqparam['c_ao']=2.
+        assert compiled(eqparam,funccomp)==model_equation(eqparam,funccomp)==1.5
+        builtins.control=True
+        assert compiled(eqparam,funccomp)==model_equation(eqparam,funccomp)==1.
+    finally:
+        builtins.control,builtins.parallelization=control,parallelization
@@ -0,0 +1,67 @@
+import numpy as np
+
+from lowEBMs.Packages.Configuration import importer, add_sellersparameters, parameterinterpolatorstepwise
+from lowEBMs.Packages.Variables import variable_importer, Vars
+from lowEBMs.Packages.RK4 import rk4alg
+from lowEBMs.Packages.ModelEquation import model_equation
+from lowEBMs.Packages.Functions import albedo, transfer
+import lowEBMs
+
+configpath=lowEBMs.__path__[0]+'/Tutorials/Config/'
+
+def run_ensemble(values,set_member,modify=None,number_of_integration=50):
+    #Running the Sellers ensemble configuration (changed by modify(config) before the variables are imported) once
+    #as parallelized run with set_member(config,values) and once per value as single run with set_member(config,value),
+    #returning both final ZMTs
+    def configure(parallel,value):
+        config=importer('EBM1D_parallel_Ensemble_config.ini',path=configpath)
+        if modify is not None:
+            modify(config)
+        config['rk4input']['number_of_integration']=number_of_integration
+        if parallel:
+            setup={'number_of_parameters': 1, 'number_of_cycles': 1, 'number_of_parallels': len(values)}
+            variable_importer(config,initialZMT=True,parallel=True,parallel_config=setup)
+        else:
+            variable_importer(config,initialZMT=True)
+        config,paras=add_sellersparameters(config,parameterinterpolatorstepwise,'SellersParameterization.ini',2,0,True,True,path=configpath+'Data/')
+        set_member(config,value)
+        rk4alg(model_equation,config['eqparam'],config['rk4input'],config['funccomp'],progressbar=False)
+        return np.array(Vars.T)
+
+    ensemble=configure(True,np.array(values))
+    single=np.array([configure(False,value) for value in values])
+    #the members differ, so that a mix-up of members would be detected
+    assert not np.allclose(single[0],single[-1])
+    return ensemble,single
+
+def test_ensemble_radius():
+    #the grid of transfer.sellers follows a radius given per ensemble member after variable_importer
+    def set_member(config,radius):
+        config['funccomp']['funcparam']['func2']['radius']=radius
+    ensemble,single=run_ensemble((6.0e6,6.371e6,6.7e6),set_member)
+    np.testing.assert_allclose(ensemble,single,rtol=1e-12)
+
+def test_ensemble_budyko_transfer():
+    #the global means, beta and the heat capacity of the members broadcast along the latitudes
+    def modify(config):
+        config['funccomp']['funclist']['func3']=transfer().budyko
+        config['funccomp']['funcparam']['func3']={'beta':3.8,'read':True,'activated':True}
+    def set_member(config,beta):
+        config['funccomp']['funcparam']['func3']['beta']=beta
+        config['eqparam']['c_ao']=config['eqparam']['c_ao']*beta/3.8
+    ensemble,single=run_ensemble((2.,3.8,6.),set_member,modify)
+    np.testing.assert_allclose(ensemble,single,rtol=1e-12)
+
+def test_ensemble_static_bud():
+    def set_member(config,alpha_p):
+        config['funccomp']['funcparam']['func0']['albedo']=albedo().static_bud
+        config['funccomp']['funcparam']['func0']['albedoparam']=[alpha_p,30,60]
+    ensemble,single=run_ensemble((0.2,0.25,0.3),set_member)
+    np.testing.assert_allclose(ensemble,single,rtol=1e-12)
+
+def test_ensemble_dynamic_bud():
+    def set_member(config,alpha_1):
+        config['funccomp']['funcparam']['func0']['albedo']=albedo().dynamic_bud
+        config['funccomp']['funcparam']['func0']['albedoparam']=[273.15-5,273.15-15,0.32,alpha_1,0.75]
+    ensemble,single=run_ensemble((0.4,0.5,0.6),set_member,number_of_integration=365)
+    np.testing.assert_allclose(ensemble,single,rtol=1e-12)
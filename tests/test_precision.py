@@ -0,0 +1,40 @@
+import numpy as np
+
+from lowEBMs.Packages.Configuration import importer, add_sellersparameters, parameterinterpolatorstepwise
+from lowEBMs.Packages.Variables import variable_importer, Vars
+from lowEBMs.Packages.RK4 import rk4alg
+from lowEBMs.Packages.ModelEquation import model_equation
+import lowEBMs
+
+configpath=lowEBMs.__path__[0]+'/Tutorials/Config/'
+
+def run_sellers(dtype,parameters_first=False,number_of_integration=100):
+    config=importer('EBM1D_Sellers_dynamic_config.ini',path=configpath)
+    config['rk4input']['number_of_integration']=number_of_integration
+    if parameters_first:
+        config,paras=add_sellersparameters(config,parameterinterpolatorstepwise,'SellersParameterization.ini',2,0,True,True,path=configpath+'Data/')
+        variable_importer(config,initialZMT=True,dtype=dtype)
+    else:
+        variable_importer(config,initialZMT=True,dtype=dtype)
+        config,paras=add_sellersparameters(config,parameterinterpolatorstepwise,'SellersParameterization.ini',2,0,True,True,path=configpath+'Data/')
+    data=rk4alg(model_equation,config['eqparam'],config['rk4input'],config['funccomp'],progressbar=False)
+    return data,np.array(Vars.T)
+
+def test_float32_state():
+    #a float32 run keeps its state in float32 and stays close to the float64 run
+    data64,T64=run_sellers(np.float64)
+    data32,T32=run_sellers(np.float32)
+    assert T64.dtype==np.float64 and T32.dtype==np.float32
+    assert Vars.Buffer['alpha'].dtype==np.float32
+    np.testing.assert_allclose(T32,T64,atol=1e-2)
+    np.testing.assert_allclose(data32[2],data64[2],atol=1e-2)
+
+def test_precision_independent_of_import_order():
+    #the Sellers parameters may be added before the variables are imported, also after a run with another precision
+    T64=run_sellers(np.float64)[1]
+    T32=run_sellers(np.float32)[1]
+    T64_first=run_sellers(np.float64,parameters_first=True)[1]
+    T32_first=run_sellers(np.float32,parameters_first=True)[1]
+    assert T64_first.dtype==np.float64 and T32_first.dtype==np.float32
+    np.testing.assert_array_equal(T64_first,T64)
+    np.testing.assert_array_equal(T32_first,T32)
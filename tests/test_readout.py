@@ -0,0 +1,47 @@
+import builtins
+import numpy as np
+
+from lowEBMs.Packages.Configuration import importer, add_sellersparameters, parameterinterpolatorstepwise
+from lowEBMs.Packages.Variables import variable_importer, Vars
+from lowEBMs.Packages.RK4 import rk4alg
+from lowEBMs.Packages.ModelEquation import model_equation
+from lowEBMs.Packages.Functions import readout
+import lowEBMs
+
+configpath=lowEBMs.__path__[0]+'/Tutorials/Config/'
+
+def run_sellers(number_of_integration=20):
+    config=importer('EBM1D_Sellers_dynamic_config.ini',path=configpath)
+    config['rk4input']['number_of_integration']=number_of_integration
+    variable_importer(config,initialZMT=True)
+    config,paras=add_sellersparameters(config,parameterinterpolatorstepwise,'SellersParameterization.ini',2,0,True,True,path=configpath+'Data/')
+    rk4alg(model_equation,config['eqparam'],config['rk4input'],config['funccomp'],progressbar=False)
+
+def test_readout_shapes():
+    #field readouts are stored as (readouts,len(Lat)) arrays, also in the storage variables of Vars
+    run_sellers()
+    n=int(builtins.number_of_integration/builtins.data_readout)
+    for key in ['Rup','Rdown','cL','C','F','P','Transfer']:
+        assert Vars.Read[key] is getattr(Vars,key)
+    for key in ['Rup','Rdown','alpha']:
+        assert np.shape(Vars.Read[key])==(n,len(Vars.Lat))
+    for key in ['cL','C','F','P']:
+        assert np.shape(Vars.Read[key])==(n,len(Vars.Lat2))
+    assert np.shape(Vars.Read['Transfer'])==(n,len(Vars.Lat))
+    assert np.all(Vars.Rup[1:]<0)
+
+def test_readout_extends_written_rows():
+    #scalar readouts written before the first array valued one are kept in the extended storage
+    Vars.Read={'Rup': np.zeros(3)}
+    Vars.Rup=Vars.Read['Rup']
+    tracker,period=builtins.Runtime_Tracker,builtins.readout_period
+    try:
+        builtins.readout_period=4
+        builtins.Runtime_Tracker=0
+        readout('Rup',5.)
+        builtins.Runtime_Tracker=4
+        readout('Rup',np.array([1.,2.]))
+    finally:
+        builtins.Runtime_Tracker,builtins.readout_period=tracker,period
+    np.testing.assert_array_equal(Vars.Rup,[[5.,5.],[1.,2.],[0.,0.]])
+    assert Vars.Rup is Vars.Read['Rup']